@@ -17,6 +17,7 @@ from app.api.dependencies.auth import get_current_user
 from app.config import get_settings
 from app.db.session import get_db
 from app.models.ai_timing import AiTimingHistory
+from app.services.ai_timing_queue import enqueue_history
 from smart_advisor.api.models import LlmProvider, User
 
 router = APIRouter()
@@ -217,19 +218,28 @@ async def _save_history(
 ) -> None:
     settings = get_settings()
     tz_name = payload.timezone or settings.timezone_default
-    entry = AiTimingHistory(
-        user_id=str(current_user.id),
-        symbol=payload.symbol.upper(),
-        symbol_name=payload.symbol_name,
-        bar_size=payload.bar_size,
-        duration_days=payload.duration_days,
-        timezone=tz_name,
-        use_rth=payload.use_rth,
-        request_payload=payload.model_dump(mode="json"),
-        response_payload=response_data,
-    )
+    row: dict[str, Any] = {
+        "user_id": str(current_user.id),
+        "symbol": payload.symbol.upper(),
+        "symbol_name": payload.symbol_name,
+        "bar_size": payload.bar_size,
+        "duration_days": payload.duration_days,
+        "timezone": tz_name,
+        "use_rth": payload.use_rth,
+        "request_payload": payload.model_dump(mode="json"),
+        "response_payload": response_data,
+    }
+    usage = response_data.get("usage") or {}
+    row["model"] = response_data.get("model")
+    row["latency_ms"] = response_data.get("latency_ms")
+    row["tokens_in"] = usage.get("input_tokens") or usage.get("prompt_tokens")
+    row["tokens_out"] = usage.get("output_tokens") or usage.get("completion_tokens")
+    # The background flusher batches rows into multi-row inserts off the
+    # request path; fall back to a synchronous write when it is not running.
+    if enqueue_history(row):
+        return
     try:
-        db.add(entry)
+        db.add(AiTimingHistory(**row))
         await db.commit()
     except Exception:  # pragma: no cover - defensive
         await db.rollback()
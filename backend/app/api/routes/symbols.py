@@ -24,12 +24,13 @@ from app.providers.ibkr_service import (
     search_symbols as search_ibkr_service,
 )
 from app.schemas.snapshots import (
-    DailyPortfolioSnapshotSchema,
+    SNAPSHOT_LIST_ADAPTER,
     TimelinePricePointSchema,
     TimelineResponse,
     TimelineTransactionSchema,
     TopMissedDaySchema,
 )
+from app.ingest.symbols import ensure_symbol
 from app.schemas.symbols import IntradayBarSchema, SymbolRefreshResponse, SymbolSearchResultSchema
 from app.services import portfolio as portfolio_client
 from app.api.dependencies.auth import get_current_user
@@ -135,22 +136,27 @@ async def get_symbol_timeline(
     stmt = stmt.order_by(DailyPortfolioSnapshot.date)
     result = await session.execute(stmt)
     rows = result.scalars().all()
-    snapshots = [
-        DailyPortfolioSnapshotSchema(
-            symbol=row.symbol,
-            date=row.date,
-            shares_open=float(row.shares_open),
-            market_value_base=float(row.market_value_base),
-            cost_basis_open_base=float(row.cost_basis_open_base),
-            unrealized_pl_base=float(row.unrealized_pl_base),
-            realized_pl_to_date_base=float(row.realized_pl_to_date_base),
-            hypo_liquidation_pl_base=float(row.hypo_liquidation_pl_base),
-            day_opportunity_base=float(row.day_opportunity_base),
-            peak_hypo_pl_to_date_base=float(row.peak_hypo_pl_to_date_base),
-            drawdown_from_peak_pct=float(row.drawdown_from_peak_pct),
-        )
-        for row in rows
-    ]
+    # One TypeAdapter call validates the whole list inside pydantic-core
+    # instead of paying per-field dispatch for each row; float coercion of
+    # the Numeric columns happens there too.
+    snapshots = SNAPSHOT_LIST_ADAPTER.validate_python(
+        [
+            {
+                "symbol": row.symbol,
+                "date": row.date,
+                "shares_open": row.shares_open,
+                "market_value_base": row.market_value_base,
+                "cost_basis_open_base": row.cost_basis_open_base,
+                "unrealized_pl_base": row.unrealized_pl_base,
+                "realized_pl_to_date_base": row.realized_pl_to_date_base,
+                "hypo_liquidation_pl_base": row.hypo_liquidation_pl_base,
+                "day_opportunity_base": row.day_opportunity_base,
+                "peak_hypo_pl_to_date_base": row.peak_hypo_pl_to_date_base,
+                "drawdown_from_peak_pct": row.drawdown_from_peak_pct,
+            }
+            for row in rows
+        ]
+    )
     price_stmt: Select = select(DailyBar).where(DailyBar.symbol == normalized)
     if from_date:
         price_stmt = price_stmt.where(DailyBar.date >= from_date)
@@ -271,6 +277,7 @@ async def _upsert_intraday_bars(
     bars: list[dict[str, Any]],
 ) -> None:
     settings = get_settings()
+    records: list[dict[str, Any]] = []
     for bar in bars:
         if not isinstance(bar, dict):
             continue
@@ -287,7 +294,7 @@ async def _upsert_intraday_bars(
         volume_value = bar.get("volume")
         if None in (open_value, high_value, low_value, close_value, volume_value):
             continue
-        record = {
+        records.append({
             "symbol": symbol,
             "bar_size": bar_size,
             "use_rth": use_rth,
@@ -298,23 +305,20 @@ async def _upsert_intraday_bars(
             "close": float(close_value),
             "volume": float(volume_value),
             "currency": str(bar.get("currency") or settings.base_currency),
-        }
-        stmt = (
-            insert(IntradayBar)
-            .values(**record)
-            .on_conflict_do_update(
-                index_elements=["symbol", "bar_size", "use_rth", "timestamp"],
-                set_={
-                    "open": record["open"],
-                    "high": record["high"],
-                    "low": record["low"],
-                    "close": record["close"],
-                    "volume": record["volume"],
-                    "currency": record["currency"],
-                },
-            )
+        })
+    if records:
+        await ensure_symbol(session, symbol)
+        # One batched upsert; the unique index resolves duplicates server-side
+        # instead of a read-before-write round-trip per bar.
+        stmt = insert(IntradayBar)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["symbol", "bar_size", "use_rth", "timestamp"],
+            set_={
+                column: getattr(stmt.excluded, column)
+                for column in ("open", "high", "low", "close", "volume", "currency")
+            },
         )
-        await session.execute(stmt)
+        await session.execute(stmt, records)
     await session.commit()
 
 
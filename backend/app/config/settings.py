@@ -26,6 +26,31 @@ class AppSettings(BaseSettings):
     )
     alembic_ini_path: str = Field(default="app/migrations/alembic.ini")
 
+    db_pool_size: int = Field(
+        default=20,
+        description="Number of persistent connections held by the engine pool.",
+    )
+    db_max_overflow: int = Field(
+        default=40,
+        description="Extra connections allowed beyond the pool size under burst load.",
+    )
+    db_pool_timeout: int = Field(
+        default=10,
+        description="Seconds to wait for a pooled connection before raising.",
+    )
+    db_pool_recycle: int = Field(
+        default=1800,
+        description="Recycle pooled connections older than this many seconds.",
+    )
+    db_pool_warm_size: int = Field(
+        default=5,
+        description="Connections to pre-open at startup so first requests skip the connect handshake.",
+    )
+    db_ingest_pool_size: int = Field(
+        default=4,
+        description="Connections reserved for bulk ingest, kept apart from the API pool.",
+    )
+
     alphavantage_api_key: str = Field(default="W7NAEL9D8ERL47FW", env="ALPHAVANTAGE_API_KEY")
     alphavantage_requests_per_minute: int = Field(default=5)
     ingest_base_url: str | None = Field(default=None, env="INGEST_BASE_URL")
@@ -55,6 +80,12 @@ class AppSettings(BaseSettings):
     telemetry_otlp_endpoint: str | None = Field(default=None)
     telemetry_otlp_insecure: bool = Field(default=True)
     telemetry_sample_ratio: float = Field(default=1.0, ge=0.0, le=1.0)
+    telemetry_db_sample_ratio: float = Field(
+        default=0.1,
+        ge=0.0,
+        le=1.0,
+        description="Sampling ratio for per-statement SQLAlchemy spans.",
+    )
 
     portfolio_service_url: str = Field(
         default="http://localhost:8200/portfolio",
@@ -0,0 +1,52 @@
+"""CORS middleware with a memoized origin check."""
+
+from __future__ import annotations
+
+from fastapi.middleware.cors import CORSMiddleware
+
+# Allow common local development origins (localhost and 127.0.0.1) on port 4200,
+# plus same-origin without port to support different setups.
+ALLOWED_ORIGINS = [
+    "http://localhost:4200",
+    "http://127.0.0.1:4200",
+    "http://localhost",
+    "http://127.0.0.1",
+]
+
+ALLOWED_ORIGIN_REGEX = r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$"
+
+EXPOSE_HEADERS = [
+    # Expose tracing/debug headers for end-to-end propagation debugging
+    "traceparent",
+    "tracestate",
+    "baggage",
+    "x-trace-id",
+    "x-request-id",
+]
+
+
+class CachedCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that caches the allow/deny decision per origin.
+
+    Starlette precompiles the origin regex and header strings at init time,
+    but still runs a regex fullmatch plus a list scan on every cross-origin
+    request. Browsers send a small, stable set of origins, so the decision is
+    memoized into a plain dict lookup.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._origin_decisions: dict[str, bool] = {}
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        allowed = self._origin_decisions.get(origin)
+        if allowed is None:
+            # Bound the memo so hostile Origin headers cannot grow it unboundedly.
+            if len(self._origin_decisions) > 256:
+                self._origin_decisions.clear()
+            allowed = super().is_allowed_origin(origin)
+            self._origin_decisions[origin] = allowed
+        return allowed
+
+
+__all__ = ["CachedCORSMiddleware", "ALLOWED_ORIGINS", "ALLOWED_ORIGIN_REGEX", "EXPOSE_HEADERS"]
@@ -3,39 +3,65 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from fastapi import FastAPI
-from opentelemetry import metrics, trace
-from opentelemetry._logs import set_logger_provider
-from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter
-from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.instrumentation.logging import LoggingInstrumentor
-from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
-from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
-from opentelemetry.instrumentation.system_metrics import SystemMetricsInstrumentor
-from opentelemetry.sdk._logs import LoggerProvider
-from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
-from opentelemetry.sdk.metrics import MeterProvider
-from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
-from opentelemetry.semconv.resource import ResourceAttributes
+from opentelemetry import trace
+from opentelemetry.baggage import get_all
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from app.config import AppSettings
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.sampling import ParentBased
+
 logger = logging.getLogger(__name__)
 
 _TELEMETRY_INITIALISED = False
 _METRIC_EXPORT_INTERVAL_MS = 10000
 
+# Batch processor tuning: a deeper queue with larger, less frequent exports
+# keeps bursty request traffic from contending on the processor lock.
+_SPAN_QUEUE_SIZE = 8192
+_SPAN_EXPORT_DELAY_MS = 5000
+_SPAN_EXPORT_BATCH_SIZE = 1024
+
+_BAGGAGE_KEYS = ("enduser.id", "enduser.role", "enduser.email")
+
+
+class BaggageSpanAttributesMiddleware:
+    """Copy end-user W3C Baggage entries onto the active server span.
+
+    Implemented as a raw ASGI middleware so each request avoids the anyio
+    task, queue and Request/Response objects that Starlette's
+    BaseHTTPMiddleware allocates for ``@app.middleware("http")`` functions.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Any, receive: Any, send: Any) -> None:
+        if scope["type"] == "http":
+            span = trace.get_current_span()
+            # Non-recording spans (sampled-out or telemetry disabled) skip
+            # the baggage walk entirely; get_all reads the context once
+            # instead of one walk per key.
+            if span.is_recording():
+                baggage = get_all()
+                for key in _BAGGAGE_KEYS:
+                    val = baggage.get(key)
+                    if val:
+                        span.set_attribute(key, val)
+        await self.app(scope, receive, send)
+
+
+def _build_resource(settings: AppSettings) -> "Resource":
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.semconv.resource import ResourceAttributes
 
-def _build_resource(settings: AppSettings) -> Resource:
     attributes: dict[str, Any] = {
         ResourceAttributes.SERVICE_NAME: settings.telemetry_service_name or settings.app_name,
         ResourceAttributes.SERVICE_NAMESPACE: "smart-advisor",
@@ -44,7 +70,11 @@ def _build_resource(settings: AppSettings) -> Resource:
 
 
 def setup_telemetry(app: FastAPI, settings: AppSettings, engine: AsyncEngine | None = None) -> None:
-    """Configure tracing exporters and instrument FastAPI plus SQLAlchemy."""
+    """Configure tracing exporters and instrument FastAPI plus SQLAlchemy.
+
+    The OpenTelemetry SDK, exporters and instrumentors are imported lazily so
+    deployments with telemetry disabled (tests, local dev) pay no import cost.
+    """
 
     global _TELEMETRY_INITIALISED  # noqa: PLW0603 - single initialisation guard
 
@@ -55,9 +85,20 @@ def setup_telemetry(app: FastAPI, settings: AppSettings, engine: AsyncEngine | N
         logger.info("Telemetry disabled via configuration")
         return
 
+    if settings.telemetry_sample_ratio == 0.0:
+        # Head sampling at zero keeps span objects being allocated just to be
+        # dropped; skipping instrumentation entirely costs nothing per request.
+        logger.info("Telemetry sample ratio is 0; skipping instrumentation")
+        return
+
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+    from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+    from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+    from opentelemetry.instrumentation.system_metrics import SystemMetricsInstrumentor
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
     resource = _build_resource(settings)
     sampler = ParentBased(TraceIdRatioBased(settings.telemetry_sample_ratio))
-    provider = TracerProvider(resource=resource, sampler=sampler)
 
     exporter_options = _build_exporter_options(settings)
 
@@ -75,9 +116,18 @@ def setup_telemetry(app: FastAPI, settings: AppSettings, engine: AsyncEngine | N
     SystemMetricsInstrumentor().instrument(meter_provider=meter_provider)
 
     if engine is not None:
+        # Per-statement spans are noisy on bulk ingest: sample them at a lower
+        # ratio than request spans and skip SQL comment injection, which would
+        # otherwise rewrite every statement on the hot insert path.
+        db_tracer_provider = _configure_db_tracing(
+            resource,
+            ParentBased(TraceIdRatioBased(settings.telemetry_db_sample_ratio)),
+            exporter_options,
+        )
         SQLAlchemyInstrumentor().instrument(
             engine=engine.sync_engine,
-            tracer_provider=tracer_provider,
+            tracer_provider=db_tracer_provider,
+            enable_commenter=False,
         )
 
     _TELEMETRY_INITIALISED = True
@@ -94,21 +144,56 @@ def _build_exporter_options(settings: AppSettings) -> dict[str, Any]:
 
 
 def _configure_tracing(
-    resource: Resource,
-    sampler: ParentBased,
+    resource: "Resource",
+    sampler: "ParentBased",
     exporter_options: dict[str, Any],
-) -> TracerProvider:
+) -> "TracerProvider":
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
     tracer_provider = TracerProvider(resource=resource, sampler=sampler)
-    span_processor = BatchSpanProcessor(OTLPSpanExporter(**exporter_options))
+    span_processor = BatchSpanProcessor(
+        OTLPSpanExporter(**exporter_options),
+        max_queue_size=_SPAN_QUEUE_SIZE,
+        schedule_delay_millis=_SPAN_EXPORT_DELAY_MS,
+        max_export_batch_size=_SPAN_EXPORT_BATCH_SIZE,
+    )
     tracer_provider.add_span_processor(span_processor)
     trace.set_tracer_provider(tracer_provider)
     return tracer_provider
 
 
+def _configure_db_tracing(
+    resource: "Resource",
+    sampler: "ParentBased",
+    exporter_options: dict[str, Any],
+) -> "TracerProvider":
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+
+    tracer_provider = TracerProvider(resource=resource, sampler=sampler)
+    tracer_provider.add_span_processor(
+        BatchSpanProcessor(
+            OTLPSpanExporter(**exporter_options),
+            max_queue_size=_SPAN_QUEUE_SIZE,
+            schedule_delay_millis=_SPAN_EXPORT_DELAY_MS,
+            max_export_batch_size=_SPAN_EXPORT_BATCH_SIZE,
+        )
+    )
+    return tracer_provider
+
+
 def _configure_metrics(
-    resource: Resource,
+    resource: "Resource",
     exporter_options: dict[str, Any],
-) -> MeterProvider:
+) -> "MeterProvider":
+    from opentelemetry import metrics
+    from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+
     metric_exporter = OTLPMetricExporter(**exporter_options)
     metric_reader = PeriodicExportingMetricReader(
         metric_exporter,
@@ -119,7 +204,13 @@ def _configure_metrics(
     return meter_provider
 
 
-def _configure_logging(resource: Resource, exporter_options: dict[str, Any]) -> None:
+def _configure_logging(resource: "Resource", exporter_options: dict[str, Any]) -> None:
+    from opentelemetry._logs import set_logger_provider
+    from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter
+    from opentelemetry.instrumentation.logging import LoggingInstrumentor
+    from opentelemetry.sdk._logs import LoggerProvider
+    from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
+
     logger_provider = LoggerProvider(resource=resource)
     log_exporter = OTLPLogExporter(**exporter_options)
     logger_provider.add_log_record_processor(BatchLogRecordProcessor(log_exporter))
@@ -127,4 +218,4 @@ def _configure_logging(resource: Resource, exporter_options: dict[str, Any]) ->
     LoggingInstrumentor().instrument(set_logging_format=False)
 
 
-__all__ = ["setup_telemetry"]
+__all__ = ["BaggageSpanAttributesMiddleware", "setup_telemetry"]
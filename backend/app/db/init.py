@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import logging
 
-from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.db.base import Base
@@ -15,6 +14,42 @@ import app.models  # noqa: F401  # pylint: disable=unused-import
 
 logger = logging.getLogger(__name__)
 
+# Issued as one batch so startup pays a single round-trip instead of eight.
+_SCHEMA_UPGRADE_SQL = """
+ALTER TABLE IF EXISTS portfolio ADD COLUMN IF NOT EXISTS owner_id VARCHAR(64);
+ALTER TABLE IF EXISTS daily_portfolio_snapshot ADD COLUMN IF NOT EXISTS portfolio_id INTEGER;
+CREATE UNIQUE INDEX IF NOT EXISTS ix_portfolio_owner_id ON portfolio(owner_id);
+ALTER TABLE IF EXISTS daily_portfolio_snapshot DROP CONSTRAINT IF EXISTS uq_snapshot_symbol_date;
+DROP INDEX IF EXISTS ix_snapshot_symbol_date;
+CREATE UNIQUE INDEX IF NOT EXISTS uq_daily_snapshot_portfolio_symbol_date
+    ON daily_portfolio_snapshot (portfolio_id, symbol, date);
+UPDATE portfolio SET owner_id = COALESCE(owner_id, 'system');
+UPDATE daily_portfolio_snapshot
+    SET portfolio_id = COALESCE(
+        portfolio_id, (SELECT id FROM portfolio WHERE owner_id = 'system' LIMIT 1)
+    );
+DO $$
+DECLARE
+    t text;
+BEGIN
+    -- create_all builds the partitioned parents without any partitions; a
+    -- DEFAULT partition makes fresh installs writable immediately, with
+    -- range partitions split out by migrations/operations later.
+    FOREACH t IN ARRAY ARRAY['daily_bar', 'intraday_bar', 'daily_portfolio_snapshot'] LOOP
+        IF EXISTS (
+            SELECT 1 FROM pg_partitioned_table pt
+            JOIN pg_class c ON c.oid = pt.partrelid
+            WHERE c.relname = t
+        ) THEN
+            EXECUTE format(
+                'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I DEFAULT',
+                t || '_default', t
+            );
+        END IF;
+    END LOOP;
+END $$;
+"""
+
 
 async def init_database() -> None:
     """Ensure all database tables exist for the running application."""
@@ -22,40 +57,12 @@ async def init_database() -> None:
     try:
         async with _engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
-            await conn.execute(
-                text("ALTER TABLE IF EXISTS portfolio ADD COLUMN IF NOT EXISTS owner_id VARCHAR(64)")
-            )
-            await conn.execute(
-                text(
-                    "ALTER TABLE IF EXISTS daily_portfolio_snapshot "
-                    "ADD COLUMN IF NOT EXISTS portfolio_id INTEGER"
-                )
-            )
-            await conn.execute(
-                text(
-                    "CREATE UNIQUE INDEX IF NOT EXISTS ix_portfolio_owner_id "
-                    "ON portfolio(owner_id)"
-                )
-            )
-            await conn.execute(
-                text("ALTER TABLE IF EXISTS daily_portfolio_snapshot DROP CONSTRAINT IF EXISTS uq_snapshot_symbol_date")
-            )
-            await conn.execute(text("DROP INDEX IF EXISTS ix_snapshot_symbol_date"))
-            await conn.execute(
-                text(
-                    "CREATE UNIQUE INDEX IF NOT EXISTS uq_daily_snapshot_portfolio_symbol_date "
-                    "ON daily_portfolio_snapshot (portfolio_id, symbol, date)"
-                )
-            )
-            await conn.execute(text("UPDATE portfolio SET owner_id = COALESCE(owner_id, 'system')"))
-            await conn.execute(
-                text(
-                    "UPDATE daily_portfolio_snapshot "
-                    "SET portfolio_id = COALESCE("
-                    "portfolio_id, (SELECT id FROM portfolio WHERE owner_id = 'system' LIMIT 1)"
-                    ")"
-                )
-            )
+            # The SQLAlchemy asyncpg dialect prepares every statement, and
+            # Postgres refuses multi-command strings in a prepared statement,
+            # so the batch goes through the raw asyncpg connection whose
+            # execute() uses the simple-query protocol: one round trip.
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.execute(_SCHEMA_UPGRADE_SQL)
     except SQLAlchemyError:
         logger.exception("Failed to initialise database schema")
         raise
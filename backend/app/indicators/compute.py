@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timedelta
 from typing import Dict
 
 import numpy as np
@@ -15,7 +17,7 @@ from app.config import get_settings
 @dataclass
 class CachedIndicators:
     symbol: str
-    as_of: datetime
+    ts: float
     data: pd.DataFrame
 
 
@@ -24,20 +26,21 @@ class IndicatorCache:
 
     def __init__(self) -> None:
         self._store: Dict[str, CachedIndicators] = {}
+        # Monotonic timestamps make expiry a float comparison instead of
+        # datetime construction and timedelta arithmetic per lookup.
+        self._ttl_seconds = get_settings().indicator_cache_ttl_minutes * 60.0
 
     def get(self, symbol: str) -> CachedIndicators | None:
-        settings = get_settings()
         cached = self._store.get(symbol)
         if not cached:
             return None
-        ttl = timedelta(minutes=settings.indicator_cache_ttl_minutes)
-        if datetime.utcnow() - cached.as_of > ttl:
+        if time.monotonic() - cached.ts > self._ttl_seconds:
             self._store.pop(symbol, None)
             return None
         return cached
 
     def set(self, symbol: str, df: pd.DataFrame) -> None:
-        self._store[symbol] = CachedIndicators(symbol=symbol, as_of=datetime.utcnow(), data=df)
+        self._store[symbol] = CachedIndicators(symbol=symbol, ts=time.monotonic(), data=df)
 
 
 _cache = IndicatorCache()
@@ -77,12 +80,27 @@ def rsi(series: pd.Series, periods: int = 14) -> pd.Series:
 
 
 def macd(series: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> pd.DataFrame:
-    ema_fast = ema(series, fast)
-    ema_slow = ema(series, slow)
+    # Smoothing factors derived once from the spans; combining the EMA outputs
+    # as raw ndarrays skips the index-alignment and Series allocation that
+    # Series arithmetic would otherwise pay per call.
+    alpha_fast = 2.0 / (fast + 1)
+    alpha_slow = 2.0 / (slow + 1)
+    alpha_signal = 2.0 / (signal + 1)
+    ema_fast = series.ewm(alpha=alpha_fast, adjust=False).mean().to_numpy()
+    ema_slow = series.ewm(alpha=alpha_slow, adjust=False).mean().to_numpy()
     macd_line = ema_fast - ema_slow
-    signal_line = ema(macd_line, signal)
+    signal_line = (
+        pd.Series(macd_line, index=series.index, copy=False)
+        .ewm(alpha=alpha_signal, adjust=False)
+        .mean()
+        .to_numpy()
+    )
     hist = macd_line - signal_line
-    return pd.DataFrame({"macd": macd_line, "signal": signal_line, "hist": hist})
+    return pd.DataFrame(
+        {"macd": macd_line, "signal": signal_line, "hist": hist},
+        index=series.index,
+        copy=False,
+    )
 
 
 def atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
@@ -118,6 +136,24 @@ def compute_indicators(symbol: str, df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def compute_indicators_many(frames: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    """Compute indicators for several symbols, fanning out across threads.
+
+    The rolling/ewm kernels run in C and release the GIL for most of their
+    work, so watchlist-sized batches scale across cores instead of looping
+    symbol-by-symbol on one.
+    """
+
+    if not frames:
+        return {}
+    if len(frames) == 1:
+        symbol, df = next(iter(frames.items()))
+        return {symbol: compute_indicators(symbol, df)}
+    with ThreadPoolExecutor(max_workers=min(len(frames), os.cpu_count() or 1)) as pool:
+        futures = {symbol: pool.submit(compute_indicators, symbol, df) for symbol, df in frames.items()}
+        return {symbol: future.result() for symbol, future in futures.items()}
+
+
 def get_cached_indicators(symbol: str) -> pd.DataFrame | None:
     cached = _cache.get(symbol)
     return cached.data if cached else None
@@ -125,6 +161,7 @@ def get_cached_indicators(symbol: str) -> pd.DataFrame | None:
 
 __all__ = [
     "compute_indicators",
+    "compute_indicators_many",
     "get_cached_indicators",
     "sma",
     "ema",
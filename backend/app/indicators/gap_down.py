@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 
+import numpy as np
 import pandas as pd
 
 
@@ -30,12 +31,16 @@ def compute_gap_down_signal(df: pd.DataFrame, symbol: str) -> GapDownSignal:
     if len(df) < 2:
         raise ValueError("Need at least 2 rows of daily OHLC data.")
 
-    today = df.iloc[-1]
-    yday = df.iloc[-2]
-
-    open_ = float(today["Open"])
-    prev_low = float(yday["Low"])
-    close_ = float(today["Close"]) if "Close" in df.columns and pd.notna(today["Close"]) else None
+    # Index the column ndarrays directly; df.iloc[-1]/[-2] would allocate a
+    # Series per row plus a string lookup per field, which adds up when this
+    # runs per symbol in a watchlist scan.
+    open_ = float(df["Open"].to_numpy()[-1])
+    prev_low = float(df["Low"].to_numpy()[-2])
+    close_: Optional[float] = None
+    if "Close" in df.columns:
+        close_raw = df["Close"].to_numpy()[-1]
+        if not np.isnan(close_raw):
+            close_ = float(close_raw)
 
     is_gap_down = open_ < prev_low
     is_up_close = (close_ > open_) if close_ is not None else None
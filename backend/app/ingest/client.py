@@ -3,7 +3,14 @@ from __future__ import annotations
 from typing import Any
 
 import httpx
-from opentelemetry.propagate import inject
+
+# Shared client so repeated ingest calls reuse pooled connections instead of
+# paying a TCP/TLS handshake per request. Trace context is injected by
+# HTTPXClientInstrumentor (see app.core.telemetry.setup_telemetry).
+_client = httpx.AsyncClient(
+    timeout=30,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+)
 
 
 class IngestServiceError(RuntimeError):
@@ -17,15 +24,7 @@ async def trigger_price_ingest(symbol: str, base_url: str, run_sync: bool = True
     """
     url = f"{base_url.rstrip('/')}/jobs/prices"
     params = {"run_sync": "true" if run_sync else "false"}
-    headers: dict[str, str] = {}
-    # Inject current trace context so ingest service links to backend span
-    try:
-        inject(headers)
-    except Exception:
-        # Best-effort; tracing injection is optional
-        pass
-    async with httpx.AsyncClient(timeout=30) as client:
-        resp = await client.post(url, json={"symbol": symbol}, params=params, headers=headers)
+    resp = await _client.post(url, json={"symbol": symbol}, params=params)
     if resp.status_code >= 400:
         try:
             payload = resp.json()
@@ -34,3 +33,9 @@ async def trigger_price_ingest(symbol: str, base_url: str, run_sync: bool = True
             detail = resp.text
         raise IngestServiceError(f"Ingest service error {resp.status_code}: {detail}")
     return resp.json()
+
+
+async def aclose_ingest_client() -> None:
+    """Close the shared HTTP client on application shutdown."""
+
+    await _client.aclose()
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.ingest.prices import parse_iso_date
+from app.ingest.views import refresh_latest_fx_rates
 from app.models import FXRate
 
 from app.providers.alpha_vantage import AlphaVantageClient, get_alpha_vantage_client
 
+_INSERT_BATCH_SIZE = 10_000
+
 
 async def ingest_fx_pair(
     from_ccy: str,
@@ -23,26 +25,27 @@ async def ingest_fx_pair(
     client = client or get_alpha_vantage_client()
     payload = await client.fx_daily(from_ccy, to_ccy)
     series = payload.get("Time Series FX (Daily)", {})
-    total = 0
-    for day_str, values in series.items():
-        day = datetime.strptime(day_str, "%Y-%m-%d").date()
-        record = {
-            "date": day,
+    rows = [
+        {
+            "date": parse_iso_date(day_str),
             "from_ccy": from_ccy,
             "to_ccy": to_ccy,
             "rate_close": float(values["4. close"]),
         }
-        stmt = (
-            insert(FXRate)
-            .values(**record)
-            .on_conflict_do_update(
-                index_elements=[FXRate.date, FXRate.from_ccy, FXRate.to_ccy],
-                set_={"rate_close": record["rate_close"]},
-            )
-        )
-        await session.execute(stmt)
-        total += 1
+        for day_str, values in series.items()
+    ]
+    stmt = insert(FXRate)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[FXRate.date, FXRate.from_ccy, FXRate.to_ccy],
+        set_={"rate_close": stmt.excluded.rate_close},
+    ).returning(FXRate.id)
+    total = 0
+    for start in range(0, len(rows), _INSERT_BATCH_SIZE):
+        result = await session.execute(stmt, rows[start : start + _INSERT_BATCH_SIZE])
+        total += len(result.scalars().all())
     await session.commit()
+    if total:
+        await refresh_latest_fx_rates()
     return total
 
 
@@ -6,15 +6,46 @@ depend on the external `services.ingest` package at import time.
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.ingest.bulk import COPY_THRESHOLD, bulk_copy_daily_bars
+from app.ingest.symbols import ensure_symbol
+from app.ingest.views import refresh_latest_daily_bars
 from app.models import DailyBar
 from app.providers.alpha_vantage import AlphaVantageClient, get_alpha_vantage_client
 from app.config import get_settings
 
+_INSERT_BATCH_SIZE = 10_000
+_UPSERT_COLUMNS = (
+    "open",
+    "high",
+    "low",
+    "close",
+    "adj_close",
+    "volume",
+    "currency",
+    "dividend_amount",
+    "split_coefficient",
+)
+
+
+def parse_iso_date(day_str: str) -> date:
+    """Parse a YYYY-MM-DD key without strptime's per-call format machinery.
+
+    For the fixed-width ISO form the whole parse is three int conversions;
+    anything else falls back to strptime, preserving its error behavior.
+    """
+
+    if len(day_str) == 10 and day_str[4] == "-" and day_str[7] == "-":
+        try:
+            return date(int(day_str[0:4]), int(day_str[5:7]), int(day_str[8:10]))
+        except ValueError:
+            pass
+    return datetime.strptime(day_str, "%Y-%m-%d").date()
+
 
 async def ingest_prices(
     symbol: str,
@@ -29,14 +60,14 @@ async def ingest_prices(
     client = client or get_alpha_vantage_client()
     payload = await client.daily_adjusted(symbol)
     series = payload.get("Time Series (Daily)", {})
-    total = 0
 
     settings = get_settings()
     # Alpha Vantage daily payload does not reliably include currency; default to base.
     currency = settings.base_currency
 
+    rows: list[dict] = []
     for day_str, values in series.items():
-        day = datetime.strptime(day_str, "%Y-%m-%d").date()
+        day = parse_iso_date(day_str)
         open_value = values.get("1. open")
         high_value = values.get("2. high")
         low_value = values.get("3. low")
@@ -46,7 +77,7 @@ async def ingest_prices(
         if adj_close_value is None or volume_value is None:
             continue
 
-        record = {
+        rows.append({
             "symbol": symbol,
             "date": day,
             "open": float(open_value) if open_value is not None else float(adj_close_value),
@@ -58,31 +89,36 @@ async def ingest_prices(
             "currency": currency,
             "dividend_amount": float(values.get("7. dividend amount", values.get("6. dividend amount", 0.0))),
             "split_coefficient": float(values.get("8. split coefficient", values.get("7. split coefficient", 1.0))),
-        }
-
-        stmt = (
-            insert(DailyBar)
-            .values(**record)
-            .on_conflict_do_update(
-                index_elements=[DailyBar.symbol, DailyBar.date],
-                set_={
-                    "open": record["open"],
-                    "high": record["high"],
-                    "low": record["low"],
-                    "close": record["close"],
-                    "adj_close": record["adj_close"],
-                    "volume": record["volume"],
-                    "currency": record["currency"],
-                    "dividend_amount": record["dividend_amount"],
-                    "split_coefficient": record["split_coefficient"],
-                },
-            )
-        )
-        await session.execute(stmt)
-        total += 1
+        })
+
+    await ensure_symbol(session, symbol)
+    if len(rows) >= COPY_THRESHOLD:
+        # Full-history backfills bypass the statement path entirely and
+        # stream over binary COPY.
+        total = await bulk_copy_daily_bars(session, rows)
+        await session.commit()
+        await refresh_latest_daily_bars()
+        return total
+
+    # One upsert statement executed with many parameter sets; the engine's
+    # insertmanyvalues paging turns each chunk into multi-VALUES inserts
+    # instead of one round-trip per bar.
+    stmt = insert(DailyBar)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[DailyBar.symbol, DailyBar.date],
+        set_={column: getattr(stmt.excluded, column) for column in _UPSERT_COLUMNS},
+    ).returning(DailyBar.id)
+    # RETURNING id reports exactly what was persisted without a follow-up
+    # SELECT, which is what snapshot backfills key off.
+    total = 0
+    for start in range(0, len(rows), _INSERT_BATCH_SIZE):
+        result = await session.execute(stmt, rows[start : start + _INSERT_BATCH_SIZE])
+        total += len(result.scalars().all())
 
     await session.commit()
+    if total:
+        await refresh_latest_daily_bars()
     return total
 
 
-__all__ = ["ingest_prices"]
+__all__ = ["ingest_prices", "parse_iso_date"]
@@ -0,0 +1,56 @@
+"""Symbol dimension registration for ingest paths.
+
+The bar tables reference ``symbol_dim``, so any ingest that may see a new
+instrument registers it first. A process-local set makes repeat calls free:
+each symbol costs one ON CONFLICT DO NOTHING round-trip per process
+lifetime, not one per ingest run.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models import SymbolDim
+
+_known_symbols: set[str] = set()
+_PENDING_KEY = "ingest_pending_symbols"
+_LISTENER_KEY = "ingest_symbol_listeners"
+
+
+def _promote_pending(sync_session: Session) -> None:
+    pending = sync_session.info.get(_PENDING_KEY)
+    if pending:
+        _known_symbols.update(pending)
+        pending.clear()
+
+
+def _discard_pending(sync_session: Session) -> None:
+    pending = sync_session.info.get(_PENDING_KEY)
+    if pending:
+        pending.clear()
+
+
+async def ensure_symbol(session: AsyncSession, symbol: str) -> None:
+    """Register ``symbol`` in the dimension table if not already seen."""
+
+    if symbol in _known_symbols:
+        return
+    stmt = insert(SymbolDim).values(symbol=symbol).on_conflict_do_nothing()
+    await session.execute(stmt)
+    # The insert is not durable until the caller's transaction commits; if
+    # it rolls back, a symbol cached now would poison the process-local set
+    # and every later bar insert for it would fail the FK. Park the symbol
+    # on the session and promote it into the cache from the commit hook.
+    sync_session = session.sync_session
+    if not sync_session.info.get(_LISTENER_KEY):
+        sync_session.info[_LISTENER_KEY] = True
+        sync_session.info[_PENDING_KEY] = set()
+        event.listen(sync_session, "after_commit", _promote_pending)
+        event.listen(sync_session, "after_rollback", _discard_pending)
+    sync_session.info[_PENDING_KEY].add(symbol)
+
+
+__all__ = ["ensure_symbol"]
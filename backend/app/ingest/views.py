@@ -0,0 +1,38 @@
+"""Materialized-view refresh hooks for the ingest jobs.
+
+``mv_latest_daily_bar`` and ``mv_latest_fx_rate`` (migration 0022) serve
+the dashboard's "latest value per key" reads; each ingest run refreshes
+the relevant view once at the end instead of recomputing DISTINCT ON per
+request. CONCURRENTLY keeps readers unblocked but cannot run inside a
+transaction, hence the dedicated autocommit connection.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from app.db.session import _ingest_engine
+
+logger = logging.getLogger(__name__)
+
+
+async def _refresh(view: str) -> None:
+    try:
+        async with _ingest_engine.connect() as conn:
+            autocommit = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await autocommit.exec_driver_sql(
+                f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"
+            )
+    except Exception:  # pragma: no cover - refresh is best-effort
+        logger.exception("Failed to refresh materialized view %s", view)
+
+
+async def refresh_latest_daily_bars() -> None:
+    await _refresh("mv_latest_daily_bar")
+
+
+async def refresh_latest_fx_rates() -> None:
+    await _refresh("mv_latest_fx_rate")
+
+
+__all__ = ["refresh_latest_daily_bars", "refresh_latest_fx_rates"]
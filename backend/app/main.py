@@ -2,100 +2,136 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
+from typing import AsyncIterator
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from opentelemetry import trace
-from opentelemetry.baggage import get_baggage
+from fastapi import APIRouter, FastAPI, Response
+from sqlalchemy import text
 
 from app.api.routes import api_router
 from app.config import get_settings
+from app.core.cors import ALLOWED_ORIGIN_REGEX, ALLOWED_ORIGINS, CachedCORSMiddleware, EXPOSE_HEADERS
 from app.core.logging import setup_logging
-from app.core.telemetry import setup_telemetry
+from app.core.telemetry import BaggageSpanAttributesMiddleware, setup_telemetry
 from app.db.init import init_database
 from app.db.session import _engine
+from app.ingest.client import aclose_ingest_client
+from app.providers.ibkr_service import aclose_ibkr_client
+from app.services.portfolio import aclose_portfolio_client
+from app.services.ai_timing_queue import start_history_flusher, stop_history_flusher
 from smart_advisor.api.admin import get_admin_router
 from smart_advisor.api.auth import get_auth_router
 from smart_advisor.api.database import database as legacy_database
 
 settings = get_settings()
-app = FastAPI(title=settings.app_name, version="0.1.0")
+
+
+async def _warm_pool(size: int) -> None:
+    """Pre-open pooled connections so first requests skip the connect handshake."""
+
+    async def warm_one() -> None:
+        async with _engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(warm_one() for _ in range(size)))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Attach routes, initialise the database schema, and warm the pool."""
+
+    configure_app()
+    await asyncio.gather(
+        init_database(),
+        legacy_database.ensure_user_role_column(),
+    )
+    await legacy_database.create_all()
+    if settings.db_pool_warm_size > 0:
+        await _warm_pool(settings.db_pool_warm_size)
+    start_history_flusher()
+    yield
+    await stop_history_flusher()
+    await aclose_ingest_client()
+    await aclose_ibkr_client()
+    await aclose_portfolio_client()
+
+
+app = FastAPI(title=settings.app_name, version="0.1.0", lifespan=lifespan)
 setup_logging()
 setup_telemetry(app, settings, engine=_engine)
 
-# Configure CORS
-# Allow common local development origins (localhost and 127.0.0.1) on port 4200,
-# plus same-origin without port to support different setups.
-allowed_origins = [
-    "http://localhost:4200",
-    "http://127.0.0.1:4200",
-    "http://localhost",
-    "http://127.0.0.1",
-]
-
+# Configure CORS; origins, regex and exposed headers live in app.core.cors.
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=allowed_origins,
-    allow_origin_regex=r"^https?://(localhost|127\.0\.0\.1)(:\d+)?$",
+    CachedCORSMiddleware,
+    allow_origins=ALLOWED_ORIGINS,
+    allow_origin_regex=ALLOWED_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=[
-        # Expose tracing/debug headers for end-to-end propagation debugging
-        "traceparent",
-        "tracestate",
-        "baggage",
-        "x-trace-id",
-        "x-request-id",
-    ],
+    expose_headers=EXPOSE_HEADERS,
 )
 
+# Attach end-user attributes from W3C Baggage to the active server span.
+# Registered as a raw ASGI middleware (added after CORS so it runs outermost).
+app.add_middleware(BaggageSpanAttributesMiddleware)
 
-@app.on_event("startup")
-async def startup() -> None:
-    """Initialise the database schema when the service boots."""
 
-    await init_database()
-    await legacy_database.ensure_user_role_column()
-    await legacy_database.create_all()
+# Load balancers poll /health at high frequency; the status and timezone
+# never change, so the body is a prebuilt byte template with the timestamp
+# spliced in, memoized briefly so repeated probes skip even that.
+_HEALTH_PREFIX = b'{"status":"ok","timezone":"' + settings.timezone.encode() + b'","timestamp":"'
+_HEALTH_SUFFIX = b'"}'
+_HEALTH_CACHE_TTL_SECONDS = 0.1
+_health_cache: tuple[float, bytes] = (0.0, b"")
 
 
 @app.get("/health", tags=["health"])
-async def health() -> dict[str, str]:
+async def health() -> Response:
     """Return service readiness metadata."""
 
-    return {
-        "status": "ok",
-        "timestamp": datetime.now().isoformat(),
-        "timezone": settings.timezone,
-    }
+    global _health_cache  # noqa: PLW0603 - tiny memo for probe traffic
+    now = time.time()
+    cached_at, body = _health_cache
+    if now - cached_at >= _HEALTH_CACHE_TTL_SECONDS:
+        body = _HEALTH_PREFIX + datetime.fromtimestamp(now).isoformat().encode() + _HEALTH_SUFFIX
+        _health_cache = (now, body)
+    return Response(content=body, media_type="application/json")
 
 
 def configure_app() -> FastAPI:
-    """Attach routes and dependencies."""
-
-    app.include_router(api_router)
-    app.include_router(get_auth_router(legacy_database))
-    app.include_router(get_admin_router(legacy_database))
+    """Attach routes and dependencies (idempotent)."""
+
+    # include_router copies every route it mounts, so re-running this on
+    # re-import (e.g. multiple uvicorn workers importing app.main) would
+    # duplicate the route table and slow request dispatch.
+    if getattr(app, "_configured", False):
+        return app
+    app._configured = True
+    # Merge the routers once and mount the composite in a single
+    # include_router call; Starlette matches routes by linear scan, so one
+    # flat, high-traffic-first route list keeps per-request matching cheap.
+    # /health is registered directly on the app and therefore scans first.
+    composite = APIRouter()
+    composite.include_router(api_router)
+    composite.include_router(get_auth_router(legacy_database))
+    composite.include_router(get_admin_router(legacy_database))
+    app.include_router(composite)
     return app
 
 
-configure_app()
+def app_factory() -> FastAPI:
+    """Return the fully configured app for servers that need routes at import.
+
+    Routes are normally attached lazily from the lifespan hook so that plain
+    ``import app.main`` (tests, worker reloaders) skips the O(routes) router
+    copy; servers that want the route table up front (``uvicorn --factory
+    app.main:app_factory``) get it here.
+    """
 
+    return configure_app()
 
-# Attach end-user attributes from W3C Baggage to the active server span
-@app.middleware("http")
-async def _attach_user_baggage(request, call_next):  # type: ignore[no-redef]
-    span = trace.get_current_span()
-    try:
-        for key in ("enduser.id", "enduser.role", "enduser.email"):
-            val = get_baggage(key)
-            if val:
-                span.set_attribute(key, val)
-    except Exception:  # best-effort only
-        pass
-    response = await call_next(request)
-    return response
 
-__all__ = ["app", "configure_app"]
+__all__ = ["app", "app_factory", "configure_app"]
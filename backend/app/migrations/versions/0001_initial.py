@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import sqlalchemy as sa
 from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
 
 revision = "0001_initial"
 down_revision = None
@@ -26,7 +27,7 @@ def upgrade() -> None:
 
     op.create_table(
         "transaction",
-        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=True), primary_key=True),
         sa.Column("portfolio_id", sa.Integer(), sa.ForeignKey("portfolio.id", ondelete="CASCADE")),
         sa.Column("symbol", sa.String(length=20), nullable=False),
         sa.Column("type", transaction_type, nullable=False),
@@ -43,8 +44,8 @@ def upgrade() -> None:
 
     op.create_table(
         "lot",
-        sa.Column("id", sa.Integer(), primary_key=True),
-        sa.Column("transaction_id", sa.Integer(), sa.ForeignKey("transaction.id", ondelete="CASCADE")),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=True), primary_key=True),
+        sa.Column("transaction_id", sa.BigInteger(), sa.ForeignKey("transaction.id", ondelete="CASCADE")),
         sa.Column("symbol", sa.String(length=20), nullable=False),
         sa.Column("open_datetime", sa.DateTime(timezone=True), nullable=False),
         sa.Column("qty_open", sa.Numeric(18, 4), nullable=False),
@@ -55,7 +56,7 @@ def upgrade() -> None:
 
     op.create_table(
         "daily_bar",
-        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=True), primary_key=True),
         sa.Column("symbol", sa.String(length=20), nullable=False),
         sa.Column("date", sa.Date(), nullable=False),
         sa.Column("adj_close", sa.Numeric(18, 6), nullable=False),
@@ -84,15 +85,15 @@ def upgrade() -> None:
         sa.Column("portfolio_id", sa.Integer(), sa.ForeignKey("portfolio.id", ondelete="CASCADE"), nullable=True),
         sa.Column("symbol", sa.String(length=20), nullable=False),
         sa.Column("date", sa.Date(), nullable=False),
-        sa.Column("shares_open", sa.Numeric(18, 6), nullable=False),
-        sa.Column("market_value_base", sa.Numeric(18, 6), nullable=False),
-        sa.Column("cost_basis_open_base", sa.Numeric(18, 6), nullable=False),
-        sa.Column("unrealized_pl_base", sa.Numeric(18, 6), nullable=False),
-        sa.Column("realized_pl_to_date_base", sa.Numeric(18, 6), nullable=False),
-        sa.Column("hypo_liquidation_pl_base", sa.Numeric(18, 6), nullable=False),
-        sa.Column("day_opportunity_base", sa.Numeric(18, 6), nullable=False),
-        sa.Column("peak_hypo_pl_to_date_base", sa.Numeric(18, 6), nullable=False),
-        sa.Column("drawdown_from_peak_pct", sa.Numeric(10, 4), nullable=False),
+        sa.Column("shares_open", sa.Float(asdecimal=False), nullable=False),
+        sa.Column("market_value_base", sa.Float(asdecimal=False), nullable=False),
+        sa.Column("cost_basis_open_base", sa.Float(asdecimal=False), nullable=False),
+        sa.Column("unrealized_pl_base", sa.Float(asdecimal=False), nullable=False),
+        sa.Column("realized_pl_to_date_base", sa.Float(asdecimal=False), nullable=False),
+        sa.Column("hypo_liquidation_pl_base", sa.Float(asdecimal=False), nullable=False),
+        sa.Column("day_opportunity_base", sa.Float(asdecimal=False), nullable=False),
+        sa.Column("peak_hypo_pl_to_date_base", sa.Float(asdecimal=False), nullable=False),
+        sa.Column("drawdown_from_peak_pct", sa.Float(asdecimal=False), nullable=False),
         sa.UniqueConstraint("portfolio_id", "symbol", "date", name="uq_snapshot_symbol_date"),
     )
     op.create_index(
@@ -103,13 +104,13 @@ def upgrade() -> None:
 
     op.create_table(
         "signal_event",
-        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=True), primary_key=True),
         sa.Column("symbol", sa.String(length=20), nullable=False),
         sa.Column("date", sa.Date(), nullable=False),
         sa.Column("rule_id", sa.String(length=64), nullable=False),
         sa.Column("signal_type", sa.String(length=32), nullable=False),
         sa.Column("severity", sa.String(length=16), nullable=True),
-        sa.Column("payload", sa.JSON(), nullable=True),
+        sa.Column("payload", JSONB(), nullable=True),
         sa.Column("cooldown_until", sa.DateTime(timezone=True), nullable=True),
     )
     op.create_index("ix_signal_event_symbol", "signal_event", ["symbol"])
@@ -135,7 +136,7 @@ def upgrade() -> None:
         sa.Column("target_price", sa.Numeric(18, 6), nullable=True),
         sa.Column("horizon_days", sa.Integer(), nullable=True),
         sa.Column("source", sa.String(length=64), nullable=True),
-        sa.Column("payload", sa.JSON(), nullable=True),
+        sa.Column("payload", JSONB(), nullable=True),
         sa.Column("verified", sa.Boolean(), nullable=False, server_default=sa.text("false")),
     )
     op.create_index("ix_analyst_snapshot_symbol", "analyst_snapshot", ["symbol"])
@@ -148,8 +149,8 @@ def upgrade() -> None:
         sa.Column("date", sa.Date(), nullable=False),
         sa.Column("horizon_days", sa.Integer(), nullable=False, server_default="30"),
         sa.Column("prob_retake_peak_30d", sa.Numeric(6, 4), nullable=True),
-        sa.Column("expected_regret_delta", sa.Numeric(18, 6), nullable=True),
-        sa.Column("payload", sa.JSON(), nullable=True),
+        sa.Column("expected_regret_delta", sa.Float(asdecimal=False), nullable=True),
+        sa.Column("payload", JSONB(), nullable=True),
     )
     op.create_index("ix_forecast_daily_symbol", "forecast_daily", ["symbol"])
     op.create_index("ix_forecast_daily_date", "forecast_daily", ["date"])
@@ -161,7 +162,7 @@ def upgrade() -> None:
         sa.Column("title", sa.String(length=128), nullable=False),
         sa.Column("timestamp_utc", sa.DateTime(timezone=True), nullable=False),
         sa.Column("importance", sa.String(length=16), nullable=True),
-        sa.Column("payload", sa.JSON(), nullable=True),
+        sa.Column("payload", JSONB(), nullable=True),
         sa.Column("impact_score", sa.Numeric(6, 3), nullable=True),
     )
     op.create_index("ix_macro_event_type", "macro_event", ["event_type"])
@@ -173,7 +174,7 @@ def upgrade() -> None:
         sa.Column("date", sa.Date(), nullable=False),
         sa.Column("metric", sa.String(length=64), nullable=False),
         sa.Column("value", sa.Numeric(18, 6), nullable=False),
-        sa.Column("payload", sa.JSON(), nullable=True),
+        sa.Column("payload", JSONB(), nullable=True),
     )
     op.create_index("ix_dashboard_kpi_date", "dashboard_kpi", ["date"])
     op.create_index("ix_dashboard_kpi_metric", "dashboard_kpi", ["metric"])
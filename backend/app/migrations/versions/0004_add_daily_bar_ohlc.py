@@ -18,23 +18,65 @@ branch_labels = None
 depends_on = None
 
 
+# Rows backfilled per statement; keeps each transaction's WAL footprint and
+# lock hold time small on large daily_bar tables.
+BACKFILL_BATCH_SIZE = 50_000
+
+
 def upgrade() -> None:
     op.add_column("daily_bar", sa.Column("open", sa.Numeric(18, 6), nullable=True))
     op.add_column("daily_bar", sa.Column("high", sa.Numeric(18, 6), nullable=True))
     op.add_column("daily_bar", sa.Column("low", sa.Numeric(18, 6), nullable=True))
     op.add_column("daily_bar", sa.Column("close", sa.Numeric(18, 6), nullable=True))
+    # Backfill in PK batches instead of one table-wide UPDATE. The columns are
+    # added together, so a single `open IS NULL` predicate identifies
+    # unpopulated rows; SKIP LOCKED keeps concurrent writers unblocked. The
+    # batches run inside an autocommit block — each one commits on its own,
+    # which is what actually bounds per-transaction WAL and lock hold time
+    # (env.py otherwise wraps the whole migration in one transaction).
+    batch_update = sa.text(
+        "WITH c AS ("
+        "SELECT id FROM daily_bar WHERE open IS NULL "
+        f"LIMIT {BACKFILL_BATCH_SIZE} FOR UPDATE SKIP LOCKED"
+        ") "
+        "UPDATE daily_bar d "
+        "SET open = adj_close, high = adj_close, low = adj_close, close = adj_close "
+        "FROM c WHERE d.id = c.id"
+    )
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        while True:
+            result = conn.execute(batch_update)
+            if result.rowcount == 0:
+                break
+    # SKIP LOCKED may have passed over rows held by concurrent writers; a
+    # final plain pass waits on those locks so SET NOT NULL cannot trip on
+    # leftover NULLs.
     op.execute(
         "UPDATE daily_bar "
         "SET open = adj_close, high = adj_close, low = adj_close, close = adj_close "
-        "WHERE open IS NULL OR high IS NULL OR low IS NULL OR close IS NULL"
+        "WHERE open IS NULL"
     )
     op.alter_column("daily_bar", "open", nullable=False)
     op.alter_column("daily_bar", "high", nullable=False)
     op.alter_column("daily_bar", "low", nullable=False)
     op.alter_column("daily_bar", "close", nullable=False)
+    # Covering index so symbol+date range scans return OHLC data from the
+    # index alone (index-only scan, no heap fetch per row). Built
+    # CONCURRENTLY to avoid blocking writers, which requires autocommit.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_daily_bar_symbol_date_covering "
+            "ON daily_bar (symbol, date) "
+            "INCLUDE (open, high, low, close, adj_close, volume)"
+        )
+    op.drop_index("ix_daily_bar_symbol_date", table_name="daily_bar")
 
 
 def downgrade() -> None:
+    op.create_index("ix_daily_bar_symbol_date", "daily_bar", ["symbol", "date"])
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_daily_bar_symbol_date_covering")
     op.drop_column("daily_bar", "close")
     op.drop_column("daily_bar", "low")
     op.drop_column("daily_bar", "high")
@@ -20,7 +20,7 @@ depends_on = None
 def upgrade() -> None:
     op.create_table(
         "intraday_bar",
-        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=True), primary_key=True),
         sa.Column("symbol", sa.String(length=20), nullable=False),
         sa.Column("bar_size", sa.String(length=16), nullable=False),
         sa.Column("use_rth", sa.Boolean(), nullable=False, server_default=sa.text("true")),
@@ -20,7 +20,7 @@ depends_on = None
 def upgrade() -> None:
     op.create_table(
         "ai_timing_history",
-        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=True), primary_key=True),
         sa.Column("user_id", sa.String(length=64), nullable=False),
         sa.Column("symbol", sa.String(length=20), nullable=False),
         sa.Column("symbol_name", sa.String(length=128), nullable=True),
@@ -37,11 +37,6 @@ def upgrade() -> None:
         "ai_timing_history",
         ["user_id", "symbol", "created_at"],
     )
-    op.create_index(
-        "ix_ai_timing_history_user_id",
-        "ai_timing_history",
-        ["user_id"],
-    )
     op.create_index(
         "ix_ai_timing_history_symbol",
         "ai_timing_history",
@@ -57,6 +52,5 @@ def upgrade() -> None:
 def downgrade() -> None:
     op.drop_index("ix_ai_timing_history_created_at", table_name="ai_timing_history")
     op.drop_index("ix_ai_timing_history_symbol", table_name="ai_timing_history")
-    op.drop_index("ix_ai_timing_history_user_id", table_name="ai_timing_history")
     op.drop_index("ix_ai_timing_history_user_symbol_created", table_name="ai_timing_history")
     op.drop_table("ai_timing_history")
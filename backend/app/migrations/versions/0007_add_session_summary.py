@@ -21,14 +21,14 @@ depends_on = None
 def upgrade() -> None:
     op.create_table(
         "session_summary",
-        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=True), primary_key=True),
         sa.Column("symbol", sa.String(length=20), nullable=False),
         sa.Column("date", sa.Date(), nullable=False),
-        sa.Column("open", sa.Numeric(18, 6), nullable=False),
-        sa.Column("midday_low", sa.Numeric(18, 6), nullable=False),
-        sa.Column("close", sa.Numeric(18, 6), nullable=False),
-        sa.Column("drawdown_pct", sa.Numeric(10, 6), nullable=False),
-        sa.Column("recovery_pct", sa.Numeric(10, 6), nullable=False),
+        sa.Column("open", sa.Float(asdecimal=False), nullable=False),
+        sa.Column("midday_low", sa.Float(asdecimal=False), nullable=False),
+        sa.Column("close", sa.Float(asdecimal=False), nullable=False),
+        sa.Column("drawdown_pct", sa.Float(asdecimal=False), nullable=False),
+        sa.Column("recovery_pct", sa.Float(asdecimal=False), nullable=False),
         sa.Column("bars", sa.Integer(), nullable=False),
         sa.Column(
             "created_at",
@@ -0,0 +1,52 @@
+"""Convert payload columns to JSONB and index signal/macro payload filters.
+
+Revision ID: 0008_payload_jsonb
+Revises: 0007_add_session_summary
+Create Date: 2026-08-31 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0008_payload_jsonb"
+down_revision = "0007_add_session_summary"
+branch_labels = None
+depends_on = None
+
+# Tables whose payload column predates the switch to JSONB in 0001.
+PAYLOAD_TABLES = (
+    "signal_event",
+    "analyst_snapshot",
+    "forecast_daily",
+    "macro_event",
+    "dashboard_kpi",
+)
+
+
+def upgrade() -> None:
+    # No-op on fresh installs (0001 now creates jsonb); existing databases
+    # get their text-backed json columns rewritten to the binary form so
+    # reads stop re-parsing and containment filters can use GIN.
+    for table in PAYLOAD_TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN payload TYPE jsonb USING payload::jsonb"
+        )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_signal_event_payload "
+        "ON signal_event USING GIN (payload jsonb_path_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_macro_event_payload "
+        "ON macro_event USING GIN (payload jsonb_path_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_macro_event_payload")
+    op.execute("DROP INDEX IF EXISTS ix_signal_event_payload")
+    for table in reversed(PAYLOAD_TABLES):
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN payload TYPE json USING payload::json"
+        )
@@ -0,0 +1,48 @@
+"""Add BRIN indexes for append-only time-series tables.
+
+Revision ID: 0009_add_brin_time_indexes
+Revises: 0008_payload_jsonb
+Create Date: 2026-08-31 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0009_add_brin_time_indexes"
+down_revision = "0008_payload_jsonb"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # These tables append in time order, so physical row order correlates
+    # tightly with the time column — BRIN's sweet spot. A BRIN index stores
+    # min/max per page range, costing megabytes instead of the btree's
+    # gigabytes and skipping most index maintenance on ingest.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_daily_bar_date_brin "
+        "ON daily_bar USING BRIN (date) WITH (pages_per_range = 32)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_intraday_bar_timestamp_brin "
+        "ON intraday_bar USING BRIN (timestamp) WITH (pages_per_range = 32)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_ai_timing_history_created_at_brin "
+        "ON ai_timing_history USING BRIN (created_at) WITH (pages_per_range = 32)"
+    )
+    # The BRIN covers pure time-range scans; per-user lookups keep the
+    # composite (user_id, symbol, created_at) btree from 0006.
+    op.execute("DROP INDEX IF EXISTS ix_ai_timing_history_created_at")
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_ai_timing_history_created_at "
+        "ON ai_timing_history (created_at)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_ai_timing_history_created_at_brin")
+    op.execute("DROP INDEX IF EXISTS ix_intraday_bar_timestamp_brin")
+    op.execute("DROP INDEX IF EXISTS ix_daily_bar_date_brin")
@@ -0,0 +1,32 @@
+"""Drop the redundant ai_timing_history user_id index.
+
+Revision ID: 0010_drop_redundant_ai_timing_index
+Revises: 0009_add_brin_time_indexes
+Create Date: 2026-08-31 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0010_drop_redundant_ai_timing_index"
+down_revision = "0009_add_brin_time_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The composite (user_id, symbol, created_at) btree already serves
+    # WHERE user_id = ? via its leftmost prefix, so the single-column index
+    # only added write amplification on this append-heavy audit table.
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_ai_timing_history_user_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_ai_timing_history_user_id "
+            "ON ai_timing_history (user_id)"
+        )
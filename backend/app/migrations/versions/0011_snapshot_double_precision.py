@@ -0,0 +1,61 @@
+"""Convert computed snapshot columns to double precision.
+
+Revision ID: 0011_snapshot_double_precision
+Revises: 0010_drop_redundant_ai_timing_index
+Create Date: 2026-08-31 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0011_snapshot_double_precision"
+down_revision = "0010_drop_redundant_ai_timing_index"
+branch_labels = None
+depends_on = None
+
+# Analytics outputs where float64 precision suffices; exact decimal semantics
+# stay only on cash-accounting columns (transaction qty/price/fee/tax,
+# lot cost basis, fx_rate.rate_close).
+COLUMN_TYPES = {
+    "daily_portfolio_snapshot": {
+        "shares_open": "numeric(18,6)",
+        "market_value_base": "numeric(18,6)",
+        "cost_basis_open_base": "numeric(18,6)",
+        "unrealized_pl_base": "numeric(18,6)",
+        "realized_pl_to_date_base": "numeric(18,6)",
+        "hypo_liquidation_pl_base": "numeric(18,6)",
+        "day_opportunity_base": "numeric(18,6)",
+        "peak_hypo_pl_to_date_base": "numeric(18,6)",
+        "drawdown_from_peak_pct": "numeric(10,4)",
+    },
+    "forecast_daily": {"expected_regret_delta": "numeric(18,6)"},
+    "session_summary": {
+        "open": "numeric(18,6)",
+        "midday_low": "numeric(18,6)",
+        "close": "numeric(18,6)",
+        "drawdown_pct": "numeric(10,6)",
+        "recovery_pct": "numeric(10,6)",
+    },
+}
+
+
+def upgrade() -> None:
+    # double precision is fixed 8 bytes and a single FPU instruction per
+    # arithmetic op, versus numeric's variable-length decimal representation.
+    for table, columns in COLUMN_TYPES.items():
+        for column in columns:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} "
+                f"TYPE double precision USING {column}::double precision"
+            )
+
+
+def downgrade() -> None:
+    for table, columns in COLUMN_TYPES.items():
+        for column, numeric_type in columns.items():
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} "
+                f"TYPE {numeric_type} USING {column}::{numeric_type}"
+            )
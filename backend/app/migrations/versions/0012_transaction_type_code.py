@@ -0,0 +1,51 @@
+"""Replace the transaction_type enum with a smallint code column.
+
+Revision ID: 0012_transaction_type_code
+Revises: 0011_snapshot_double_precision
+Create Date: 2026-08-31 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0012_transaction_type_code"
+down_revision = "0011_snapshot_double_precision"
+branch_labels = None
+depends_on = None
+
+# Mirrors TransactionType._CODES in app.models.portfolio.
+TYPE_CODES = {"BUY": 1, "SELL": 2, "DIVIDEND": 3, "FEE": 4, "SPLIT": 5}
+
+
+def _case_expr(mapping: dict[str, int]) -> str:
+    whens = " ".join(f"WHEN '{name}' THEN {code}" for name, code in mapping.items())
+    return f"CASE type {whens} END"
+
+
+def upgrade() -> None:
+    op.add_column("transaction", sa.Column("type_code", sa.SmallInteger(), nullable=True))
+    op.execute(f"UPDATE transaction SET type_code = {_case_expr(TYPE_CODES)}")
+    op.alter_column("transaction", "type_code", nullable=False)
+    op.create_check_constraint(
+        "ck_transaction_type_code", "transaction", "type_code BETWEEN 1 AND 5"
+    )
+    op.drop_column("transaction", "type")
+    op.execute("DROP TYPE IF EXISTS transaction_type")
+
+
+def downgrade() -> None:
+    transaction_type = sa.Enum(
+        "BUY", "SELL", "DIVIDEND", "FEE", "SPLIT", name="transaction_type"
+    )
+    transaction_type.create(op.get_bind(), checkfirst=True)
+    op.add_column("transaction", sa.Column("type", transaction_type, nullable=True))
+    whens = " ".join(
+        f"WHEN {code} THEN '{name}'::transaction_type" for name, code in TYPE_CODES.items()
+    )
+    op.execute(f"UPDATE transaction SET type = CASE type_code {whens} END")
+    op.alter_column("transaction", "type", nullable=False)
+    op.drop_constraint("ck_transaction_type_code", "transaction")
+    op.drop_column("transaction", "type_code")
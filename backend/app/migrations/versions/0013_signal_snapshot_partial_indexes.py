@@ -0,0 +1,51 @@
+"""Targeted indexes for active-signal and recent-snapshot queries.
+
+Revision ID: 0013_signal_snapshot_partial_indexes
+Revises: 0012_transaction_type_code
+Create Date: 2026-08-31 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0013_signal_snapshot_partial_indexes"
+down_revision = "0012_transaction_type_code"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Index predicates must be IMMUTABLE, so "not yet expired" cannot use
+    # now(); instead the partial index covers the rows that carry a cooldown
+    # at all — the subset the active-signal query actually has to re-check —
+    # while cooldown-free rows match by absence.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_signal_event_cooldown "
+            "ON signal_event (symbol, date DESC, cooldown_until) "
+            "WHERE cooldown_until IS NOT NULL"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_signal_event_symbol_date "
+            "ON signal_event (symbol, date DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_snapshot_symbol_date_desc "
+            "ON daily_portfolio_snapshot (symbol, date DESC)"
+        )
+        # Covered by the leading column of ix_signal_event_symbol_date; the
+        # date-only and rule-only btrees stay for their own query shapes.
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_signal_event_symbol")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_signal_event_symbol "
+            "ON signal_event (symbol)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_snapshot_symbol_date_desc")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_signal_event_symbol_date")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_signal_event_cooldown")
@@ -0,0 +1,77 @@
+"""Add a currency lookup table and reference it from currency columns.
+
+Revision ID: 0014_currency_lookup
+Revises: 0013_signal_snapshot_partial_indexes
+Create Date: 2026-08-31 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0014_currency_lookup"
+down_revision = "0013_signal_snapshot_partial_indexes"
+branch_labels = None
+depends_on = None
+
+# Currencies the app actually ingests; unknown codes are inserted on demand
+# by the backfill below before the FKs are validated.
+SEED_CURRENCIES = (
+    ("USD", "US Dollar"),
+    ("EUR", "Euro"),
+    ("GBP", "Pound Sterling"),
+    ("AED", "UAE Dirham"),
+    ("SAR", "Saudi Riyal"),
+    ("JPY", "Japanese Yen"),
+    ("CHF", "Swiss Franc"),
+    ("CAD", "Canadian Dollar"),
+    ("AUD", "Australian Dollar"),
+)
+
+CURRENCY_COLUMNS = (
+    ("portfolio", "base_currency"),
+    ("transaction", "currency"),
+    ("daily_bar", "currency"),
+    ("intraday_bar", "currency"),
+    ("portfolio_account", "currency"),
+    ("fx_rate", "from_ccy"),
+    ("fx_rate", "to_ccy"),
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "currency",
+        sa.Column("code", sa.CHAR(3), primary_key=True),
+        sa.Column("name", sa.String(length=64), nullable=True),
+    )
+    conn = op.get_bind()
+    for code, name in SEED_CURRENCIES:
+        conn.execute(
+            sa.text("INSERT INTO currency (code, name) VALUES (:code, :name) ON CONFLICT DO NOTHING"),
+            {"code": code, "name": name},
+        )
+    for table, column in CURRENCY_COLUMNS:
+        # Register any code already in use so the FK validates cleanly.
+        op.execute(
+            f"INSERT INTO currency (code) "
+            f"SELECT DISTINCT {column} FROM {table} WHERE {column} IS NOT NULL "
+            f"ON CONFLICT DO NOTHING"
+        )
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE char(3)")
+        # NOT VALID takes only a brief lock; VALIDATE scans without blocking writes.
+        constraint = f"fk_{table}_{column}_currency"
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {constraint} "
+            f"FOREIGN KEY ({column}) REFERENCES currency (code) NOT VALID"
+        )
+        op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {constraint}")
+
+
+def downgrade() -> None:
+    for table, column in reversed(CURRENCY_COLUMNS):
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS fk_{table}_{column}_currency")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar(3)")
+    op.drop_table("currency")
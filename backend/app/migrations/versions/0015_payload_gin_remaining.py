@@ -0,0 +1,39 @@
+"""GIN payload indexes for the remaining JSONB tables.
+
+Revision ID: 0015_payload_gin_remaining
+Revises: 0014_currency_lookup
+Create Date: 2026-08-31 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0015_payload_gin_remaining"
+down_revision = "0014_currency_lookup"
+branch_labels = None
+depends_on = None
+
+# signal_event and macro_event got their GIN indexes in 0008; these three
+# were converted to jsonb there but left unindexed.
+PAYLOAD_INDEXES = (
+    ("analyst_snapshot", "ix_analyst_snapshot_payload"),
+    ("forecast_daily", "ix_forecast_daily_payload"),
+    ("dashboard_kpi", "ix_dashboard_kpi_payload"),
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, name in PAYLOAD_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING GIN (payload jsonb_path_ops)"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for _table, name in reversed(PAYLOAD_INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
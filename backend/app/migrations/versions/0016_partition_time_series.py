@@ -0,0 +1,146 @@
+"""Range-partition the append-only time-series tables.
+
+Revision ID: 0016_partition_time_series
+Revises: 0015_payload_gin_remaining
+Create Date: 2026-08-31 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0016_partition_time_series"
+down_revision = "0015_payload_gin_remaining"
+branch_labels = None
+depends_on = None
+
+# (table, partition key, months per partition, secondary DDL to recreate)
+# daily tables get quarterly partitions, intraday gets monthly.
+PARTITIONED_TABLES = (
+    (
+        "daily_bar",
+        "date",
+        3,
+        (
+            "ALTER TABLE daily_bar ADD CONSTRAINT uq_daily_bar_symbol_date UNIQUE (symbol, date)",
+            "CREATE INDEX ix_daily_bar_symbol_date ON daily_bar (symbol, date)",
+            "ALTER TABLE daily_bar ADD CONSTRAINT fk_daily_bar_currency_currency "
+            "FOREIGN KEY (currency) REFERENCES currency (code)",
+        ),
+    ),
+    (
+        "intraday_bar",
+        "timestamp",
+        1,
+        (
+            "ALTER TABLE intraday_bar ADD CONSTRAINT uq_intraday_bar_key "
+            'UNIQUE (symbol, bar_size, use_rth, "timestamp")',
+            "CREATE INDEX ix_intraday_bar_symbol_ts "
+            'ON intraday_bar (symbol, bar_size, use_rth, "timestamp")',
+            "ALTER TABLE intraday_bar ADD CONSTRAINT fk_intraday_bar_currency_currency "
+            "FOREIGN KEY (currency) REFERENCES currency (code)",
+        ),
+    ),
+    (
+        "daily_portfolio_snapshot",
+        "date",
+        3,
+        (
+            "CREATE UNIQUE INDEX uq_daily_snapshot_portfolio_symbol_date "
+            "ON daily_portfolio_snapshot (portfolio_id, symbol, date)",
+            "CREATE INDEX ix_snapshot_symbol_date_desc "
+            "ON daily_portfolio_snapshot (symbol, date DESC)",
+            "ALTER TABLE daily_portfolio_snapshot "
+            "ADD CONSTRAINT daily_portfolio_snapshot_portfolio_id_fkey "
+            "FOREIGN KEY (portfolio_id) REFERENCES portfolio (id) ON DELETE CASCADE",
+        ),
+    ),
+)
+
+
+def _period_start(day: dt.date, months: int) -> dt.date:
+    month = ((day.month - 1) // months) * months + 1
+    return day.replace(month=month, day=1)
+
+
+def _add_months(day: dt.date, months: int) -> dt.date:
+    month0 = day.month - 1 + months
+    return dt.date(day.year + month0 // 12, month0 % 12 + 1, 1)
+
+
+def _create_partitions(conn, table: str, key: str, months: int) -> None:
+    """Create range partitions covering existing data plus a year ahead."""
+
+    lo, hi = conn.execute(
+        sa.text(f'SELECT min("{key}")::date, max("{key}")::date FROM {table}_old')
+    ).one()
+    today = dt.date.today()
+    start = _period_start(min(lo or today, today), months)
+    end = _add_months(_period_start(max(hi or today, today), months), 12)
+    cursor = start
+    while cursor < end:
+        upper = _add_months(cursor, months)
+        conn.execute(
+            sa.text(
+                f"CREATE TABLE {table}_p{cursor:%Y%m} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{cursor:%Y-%m-%d}') TO ('{upper:%Y-%m-%d}')"
+            )
+        )
+        cursor = upper
+    # Catch-all so out-of-range rows never fail the insert path.
+    conn.execute(sa.text(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT"))
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    for table, key, months, secondary_ddl in PARTITIONED_TABLES:
+        op.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+        # LIKE keeps the column list in lockstep with whatever earlier
+        # migrations produced; identity is deliberately not copied because
+        # partitioned parents cannot carry identity columns, so id falls
+        # back to an explicit sequence default.
+        op.execute(
+            f"CREATE TABLE {table} "
+            f"(LIKE {table}_old INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+            f'PARTITION BY RANGE ("{key}")'
+        )
+        op.execute(f'ALTER TABLE {table} ADD PRIMARY KEY (id, "{key}")')
+        op.execute(f"CREATE SEQUENCE {table}_id_seq1")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{table}_id_seq1')"
+        )
+        op.execute(f"ALTER SEQUENCE {table}_id_seq1 OWNED BY {table}.id")
+        _create_partitions(conn, table, key, months)
+        op.execute(f"INSERT INTO {table} SELECT * FROM {table}_old")
+        op.execute(
+            f"SELECT setval('{table}_id_seq1', COALESCE((SELECT max(id) FROM {table}), 1))"
+        )
+        op.execute(f"DROP TABLE {table}_old")
+        for ddl in secondary_ddl:
+            op.execute(ddl)
+
+
+def downgrade() -> None:
+    for table, key, _months, secondary_ddl in reversed(PARTITIONED_TABLES):
+        op.execute(f"ALTER TABLE {table} RENAME TO {table}_part")
+        op.execute(
+            f"CREATE TABLE {table} "
+            f"(LIKE {table}_part INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+        op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id)")
+        op.execute(f"INSERT INTO {table} SELECT * FROM {table}_part")
+        op.execute(f"DROP TABLE {table}_part")
+        op.execute(f"CREATE SEQUENCE {table}_id_seq1")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{table}_id_seq1')"
+        )
+        op.execute(f"ALTER SEQUENCE {table}_id_seq1 OWNED BY {table}.id")
+        op.execute(
+            f"SELECT setval('{table}_id_seq1', COALESCE((SELECT max(id) FROM {table}), 1))"
+        )
+        for ddl in secondary_ddl:
+            op.execute(ddl)
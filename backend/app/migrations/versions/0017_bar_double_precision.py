@@ -0,0 +1,56 @@
+"""Convert OHLCV bar columns to double precision.
+
+Revision ID: 0017_bar_double_precision
+Revises: 0016_partition_time_series
+Create Date: 2026-08-31 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0017_bar_double_precision"
+down_revision = "0016_partition_time_series"
+branch_labels = None
+depends_on = None
+
+# Market-data bars are analytics inputs, not accounting records; float64
+# matches the pandas pipeline that consumes them and is 8 fixed bytes per
+# value versus numeric's variable-length form. Exact decimal stays on
+# transaction/lot amounts and fx_rate.rate_close.
+COLUMN_TYPES = {
+    "daily_bar": {
+        "open": "numeric(18,6)",
+        "high": "numeric(18,6)",
+        "low": "numeric(18,6)",
+        "close": "numeric(18,6)",
+        "adj_close": "numeric(18,6)",
+        "volume": "numeric(20,2)",
+    },
+    "intraday_bar": {
+        "open": "numeric(18,6)",
+        "high": "numeric(18,6)",
+        "low": "numeric(18,6)",
+        "close": "numeric(18,6)",
+        "volume": "numeric(20,2)",
+    },
+}
+
+
+def upgrade() -> None:
+    for table, columns in COLUMN_TYPES.items():
+        for column in columns:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} "
+                f"TYPE double precision USING {column}::double precision"
+            )
+
+
+def downgrade() -> None:
+    for table, columns in COLUMN_TYPES.items():
+        for column, numeric_type in columns.items():
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} "
+                f"TYPE {numeric_type} USING {column}::{numeric_type}"
+            )
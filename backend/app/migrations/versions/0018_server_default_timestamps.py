@@ -0,0 +1,38 @@
+"""Move created_at/decision_at defaults server-side.
+
+Revision ID: 0018_server_default_timestamps
+Revises: 0017_bar_double_precision
+Create Date: 2026-08-31 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0018_server_default_timestamps"
+down_revision = "0017_bar_double_precision"
+branch_labels = None
+depends_on = None
+
+# Columns previously filled by Python default=datetime.utcnow; a server
+# default drops one bound parameter per row from bulk inserts.
+TIMESTAMP_COLUMNS = (
+    ("ai_timing_history", "created_at"),
+    ("portfolio_symbol", "created_at"),
+    ("portfolio_account", "created_at"),
+    ("investment_decision", "decision_at"),
+)
+
+
+def upgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.execute(f"UPDATE {table} SET {column} = now() WHERE {column} IS NULL")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT now()")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET NOT NULL")
+
+
+def downgrade() -> None:
+    for table, column in reversed(TIMESTAMP_COLUMNS):
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP NOT NULL")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
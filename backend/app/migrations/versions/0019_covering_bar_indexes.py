@@ -0,0 +1,59 @@
+"""Covering (INCLUDE) indexes for bar and FX lookups.
+
+Revision ID: 0019_covering_bar_indexes
+Revises: 0018_server_default_timestamps
+Create Date: 2026-08-31 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0019_covering_bar_indexes"
+down_revision = "0018_server_default_timestamps"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # daily_bar/intraday_bar are partitioned parents (0016), where
+    # CONCURRENTLY is not supported. The plain composite indexes duplicate
+    # the key columns of the unique constraints, so they go away once the
+    # INCLUDE variants exist.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_daily_bar_symbol_date_covering "
+        "ON daily_bar (symbol, date) INCLUDE (adj_close, close, volume)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_daily_bar_symbol_date")
+    op.execute("DROP INDEX IF EXISTS ix_intraday_bar_symbol_ts")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_intraday_bar_symbol_ts "
+        'ON intraday_bar (symbol, bar_size, use_rth, "timestamp") '
+        "INCLUDE (close, volume)"
+    )
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_fx_rate_pair")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_fx_rate_pair "
+            "ON fx_rate (from_ccy, to_ccy, date) INCLUDE (rate_close)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_fx_rate_pair")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_fx_rate_pair "
+            "ON fx_rate (from_ccy, to_ccy, date)"
+        )
+    op.execute("DROP INDEX IF EXISTS ix_intraday_bar_symbol_ts")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_intraday_bar_symbol_ts "
+        'ON intraday_bar (symbol, bar_size, use_rth, "timestamp")'
+    )
+    op.execute("DROP INDEX IF EXISTS ix_daily_bar_symbol_date_covering")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_daily_bar_symbol_date "
+        "ON daily_bar (symbol, date)"
+    )
@@ -0,0 +1,46 @@
+"""BRIN index for macro_event; restore bar BRINs lost in the partition rebuild.
+
+Revision ID: 0020_brin_macro_event
+Revises: 0019_covering_bar_indexes
+Create Date: 2026-08-31 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0020_brin_macro_event"
+down_revision = "0019_covering_bar_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_macro_event_timestamp_utc_brin "
+        "ON macro_event USING BRIN (timestamp_utc) WITH (pages_per_range = 32)"
+    )
+    # Range windows dominate macro_event reads; the BRIN replaces the
+    # per-row btree the same way 0009 did for ai_timing_history.
+    op.execute("DROP INDEX IF EXISTS ix_macro_event_timestamp_utc")
+    # 0016 rebuilt the bar tables as partitioned parents, which dropped the
+    # BRIN indexes 0009 had created; recreate them on the parents.
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_daily_bar_date_brin "
+        "ON daily_bar USING BRIN (date) WITH (pages_per_range = 32)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_intraday_bar_timestamp_brin "
+        'ON intraday_bar USING BRIN ("timestamp") WITH (pages_per_range = 32)'
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_intraday_bar_timestamp_brin")
+    op.execute("DROP INDEX IF EXISTS ix_daily_bar_date_brin")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_macro_event_timestamp_utc "
+        "ON macro_event (timestamp_utc)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_macro_event_timestamp_utc_brin")
@@ -0,0 +1,60 @@
+"""Add a symbol dimension table referenced by the bar tables.
+
+Revision ID: 0021_symbol_dim
+Revises: 0020_brin_macro_event
+Create Date: 2026-08-31 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0021_symbol_dim"
+down_revision = "0020_brin_macro_event"
+branch_labels = None
+depends_on = None
+
+# Market-data tables whose symbol column references the dimension; the
+# portfolio-side tables keep plain text, their symbols arrive from user
+# input rather than ingest.
+SYMBOL_TABLES = ("daily_bar", "intraday_bar")
+
+# Existing symbols across the tree, registered before the FKs attach.
+BACKFILL_TABLES = (
+    "daily_bar",
+    "intraday_bar",
+    "daily_portfolio_snapshot",
+    "signal_event",
+    "ticker_sentiment_daily",
+    "portfolio_symbol",
+    "transaction",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "symbol_dim",
+        sa.Column("symbol", sa.String(length=20), primary_key=True),
+        sa.Column("name", sa.String(length=128), nullable=True),
+    )
+    for table in BACKFILL_TABLES:
+        op.execute(
+            f"INSERT INTO symbol_dim (symbol) "
+            f"SELECT DISTINCT symbol FROM {table} WHERE symbol IS NOT NULL "
+            f"ON CONFLICT DO NOTHING"
+        )
+    for table in SYMBOL_TABLES:
+        # Partitioned tables cannot take NOT VALID foreign keys, so these
+        # validate inline; the backfill above guarantees a clean pass.
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT fk_{table}_symbol_dim "
+            f"FOREIGN KEY (symbol) REFERENCES symbol_dim (symbol)"
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(SYMBOL_TABLES):
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS fk_{table}_symbol_dim")
+    op.drop_table("symbol_dim")
@@ -0,0 +1,45 @@
+"""Materialized views for latest bar and FX rate per key.
+
+Revision ID: 0022_latest_bar_matviews
+Revises: 0021_symbol_dim
+Create Date: 2026-08-31 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0022_latest_bar_matviews"
+down_revision = "0021_symbol_dim"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Dashboard "latest close per symbol" otherwise re-runs DISTINCT ON over
+    # the whole bar history; the unique indexes make the reads point lookups
+    # and enable REFRESH ... CONCURRENTLY after ingest.
+    op.execute(
+        "CREATE MATERIALIZED VIEW mv_latest_daily_bar AS "
+        "SELECT DISTINCT ON (symbol) symbol, date, adj_close, close, volume "
+        "FROM daily_bar ORDER BY symbol, date DESC"
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_mv_latest_daily_bar_symbol "
+        "ON mv_latest_daily_bar (symbol)"
+    )
+    op.execute(
+        "CREATE MATERIALIZED VIEW mv_latest_fx_rate AS "
+        "SELECT DISTINCT ON (from_ccy, to_ccy) from_ccy, to_ccy, date, rate_close "
+        "FROM fx_rate ORDER BY from_ccy, to_ccy, date DESC"
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_mv_latest_fx_rate_pair "
+        "ON mv_latest_fx_rate (from_ccy, to_ccy)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_latest_fx_rate")
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_latest_daily_bar")
@@ -0,0 +1,74 @@
+"""Collapse duplicate btrees left next to composite/unique indexes.
+
+Revision ID: 0023_drop_duplicate_indexes
+Revises: 0022_latest_bar_matviews
+Create Date: 2026-08-31 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0023_drop_duplicate_indexes"
+down_revision = "0022_latest_bar_matviews"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The bar tables carried two btrees over identical key columns: the
+    # unique constraint and the covering index from 0019. Rebuild the
+    # covering index as UNIQUE (ON CONFLICT resolves against any unique
+    # index) and drop the constraint, halving insert-time index writes.
+    # The constraint enforces uniqueness throughout the swap.
+    op.execute("DROP INDEX IF EXISTS ix_daily_bar_symbol_date_covering")
+    op.execute(
+        "CREATE UNIQUE INDEX ix_daily_bar_symbol_date_covering "
+        "ON daily_bar (symbol, date) INCLUDE (adj_close, close, volume)"
+    )
+    op.execute("ALTER TABLE daily_bar DROP CONSTRAINT IF EXISTS uq_daily_bar_symbol_date")
+    op.execute("DROP INDEX IF EXISTS ix_intraday_bar_symbol_ts")
+    op.execute(
+        "CREATE UNIQUE INDEX ix_intraday_bar_symbol_ts "
+        'ON intraday_bar (symbol, bar_size, use_rth, "timestamp") '
+        "INCLUDE (close, volume)"
+    )
+    op.execute("ALTER TABLE intraday_bar DROP CONSTRAINT IF EXISTS uq_intraday_bar_key")
+    with op.get_context().autocommit_block():
+        # Left-anchored prefixes of composite indexes: (symbol) is covered by
+        # ix_transaction_symbol_datetime, (user_id, symbol) lookups by
+        # ix_ai_timing_history_user_symbol_created.
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_transaction_symbol")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_ai_timing_history_symbol")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_ai_timing_history_symbol "
+            "ON ai_timing_history (symbol)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transaction_symbol "
+            'ON "transaction" (symbol)'
+        )
+    op.execute(
+        "ALTER TABLE intraday_bar ADD CONSTRAINT uq_intraday_bar_key "
+        'UNIQUE (symbol, bar_size, use_rth, "timestamp")'
+    )
+    op.execute("DROP INDEX IF EXISTS ix_intraday_bar_symbol_ts")
+    op.execute(
+        "CREATE INDEX ix_intraday_bar_symbol_ts "
+        'ON intraday_bar (symbol, bar_size, use_rth, "timestamp") '
+        "INCLUDE (close, volume)"
+    )
+    op.execute(
+        "ALTER TABLE daily_bar ADD CONSTRAINT uq_daily_bar_symbol_date "
+        "UNIQUE (symbol, date)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_daily_bar_symbol_date_covering")
+    op.execute(
+        "CREATE INDEX ix_daily_bar_symbol_date_covering "
+        "ON daily_bar (symbol, date) INCLUDE (adj_close, close, volume)"
+    )
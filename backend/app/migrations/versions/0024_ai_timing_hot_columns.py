@@ -0,0 +1,64 @@
+"""Promote hot AI timing payload fields to columns.
+
+Revision ID: 0024_ai_timing_hot_columns
+Revises: 0023_drop_duplicate_indexes
+Create Date: 2026-08-31 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision = "0024_ai_timing_hot_columns"
+down_revision = "0023_drop_duplicate_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("ai_timing_history", sa.Column("model", sa.String(length=64), nullable=True))
+    op.add_column("ai_timing_history", sa.Column("latency_ms", sa.Integer(), nullable=True))
+    op.add_column("ai_timing_history", sa.Column("tokens_in", sa.Integer(), nullable=True))
+    op.add_column("ai_timing_history", sa.Column("tokens_out", sa.Integer(), nullable=True))
+    # Backfill from the blob once; new rows carry the columns directly.
+    op.execute(
+        """
+        UPDATE ai_timing_history SET
+            model = response_payload->>'model',
+            latency_ms = (response_payload->>'latency_ms')::int,
+            tokens_in = COALESCE(
+                response_payload#>>'{usage,input_tokens}',
+                response_payload#>>'{usage,prompt_tokens}'
+            )::int,
+            tokens_out = COALESCE(
+                response_payload#>>'{usage,output_tokens}',
+                response_payload#>>'{usage,completion_tokens}'
+            )::int
+        """
+    )
+    op.create_index("ix_ai_timing_history_model", "ai_timing_history", ["model"])
+    # EXTERNAL keeps the blobs out-of-line but uncompressed: reads that do
+    # touch a payload skip the TOAST decompression pass, trading disk for
+    # CPU on a column that is fetched far more often than it is filtered.
+    op.execute(
+        "ALTER TABLE ai_timing_history ALTER COLUMN response_payload SET STORAGE EXTERNAL"
+    )
+    op.execute(
+        "ALTER TABLE ai_timing_history ALTER COLUMN request_payload SET STORAGE EXTERNAL"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE ai_timing_history ALTER COLUMN request_payload SET STORAGE EXTENDED"
+    )
+    op.execute(
+        "ALTER TABLE ai_timing_history ALTER COLUMN response_payload SET STORAGE EXTENDED"
+    )
+    op.drop_index("ix_ai_timing_history_model", table_name="ai_timing_history")
+    op.drop_column("ai_timing_history", "tokens_out")
+    op.drop_column("ai_timing_history", "tokens_in")
+    op.drop_column("ai_timing_history", "latency_ms")
+    op.drop_column("ai_timing_history", "model")
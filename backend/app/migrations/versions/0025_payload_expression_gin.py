@@ -0,0 +1,37 @@
+"""Expression GIN indexes on the concentrated payload filter keys.
+
+Revision ID: 0025_payload_expression_gin
+Revises: 0024_ai_timing_hot_columns
+Create Date: 2026-08-31 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0025_payload_expression_gin"
+down_revision = "0024_ai_timing_hot_columns"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Far smaller than the whole-document GINs when a filter touches only
+    # one key; queries must use containment (payload->'country' @> '"US"')
+    # for these to apply.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_macro_event_payload_country "
+            "ON macro_event USING GIN ((payload -> 'country') jsonb_path_ops)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_analyst_snapshot_payload_sector "
+            "ON analyst_snapshot USING GIN ((payload -> 'sector') jsonb_path_ops)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_analyst_snapshot_payload_sector")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_macro_event_payload_country")
@@ -1,7 +1,16 @@
-"""Database model exports."""
+"""Database model exports.
+
+This package is the single canonical model registry: every model imports
+here exactly once so ``Base.metadata`` is deterministic and fully
+populated before ``create_all``/relationship configuration runs (see
+``app.db.init``). Keep imports eager — lazily importing a model would
+leave its table out of the metadata for whichever process triggers
+schema creation first.
+"""
 
 from .ai_timing import AiTimingHistory
 from .analyst import AnalystSnapshot
+from .currency import Currency
 from .dashboard import DashboardKPI
 from .daily import DailyBar, DailyPortfolioSnapshot, FXRate
 from .forecast import ForecastDaily
@@ -18,6 +27,7 @@ from .portfolio import (
     Transaction,
 )
 from .session_summary import SessionSummary
+from .symbol import SymbolDim
 from .sentiment import SignalEvent, TickerSentimentDaily
 
 __all__ = [
@@ -41,4 +51,6 @@ __all__ = [
     "MacroEvent",
     "DashboardKPI",
     "SessionSummary",
+    "Currency",
+    "SymbolDim",
 ]
@@ -0,0 +1,27 @@
+"""Shared column types for the ORM models."""
+
+from __future__ import annotations
+
+from sqlalchemy import JSON, Dialect, TypeDecorator
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import TypeEngine
+
+
+class FastJSONB(TypeDecorator):
+    """JSONB on PostgreSQL, generic JSON elsewhere (sqlite dev databases).
+
+    The engine in ``app.db.session`` wires orjson as the JSON codec, so
+    payload columns typed with this decode through orjson's C parser instead
+    of the stdlib ``json`` module on every row read.
+    """
+
+    impl = JSONB
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(JSONB())
+        return dialect.type_descriptor(JSON())
+
+
+__all__ = ["FastJSONB"]
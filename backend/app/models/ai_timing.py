@@ -5,30 +5,44 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Boolean, DateTime, Index, Integer, String
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.models._types import FastJSONB
 
 
 class AiTimingHistory(Base):
     __tablename__ = "ai_timing_history"
     __table_args__ = (
         Index("ix_ai_timing_history_user_symbol_created", "user_id", "symbol", "created_at"),
+        # Rows append in time order, so BRIN covers pure time-range scans at
+        # a fraction of a btree's size (0009 dropped the created_at btree).
+        Index(
+            "ix_ai_timing_history_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    user_id: Mapped[str] = mapped_column(String(64), index=True)
-    symbol: Mapped[str] = mapped_column(String(20), index=True)
+    user_id: Mapped[str] = mapped_column(String(64))
+    symbol: Mapped[str] = mapped_column(String(20))
     symbol_name: Mapped[str | None] = mapped_column(String(128), nullable=True)
     bar_size: Mapped[str] = mapped_column(String(16))
     duration_days: Mapped[int] = mapped_column(Integer)
     timezone: Mapped[str] = mapped_column(String(64))
     use_rth: Mapped[bool] = mapped_column(Boolean, default=True)
-    request_payload: Mapped[dict[str, Any]] = mapped_column(JSONB)
-    response_payload: Mapped[dict[str, Any]] = mapped_column(JSONB)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow, index=True)
+    # Hot fields promoted out of the JSONB blobs: reading them no longer
+    # detoasts and parses the full payload per row.
+    model: Mapped[str | None] = mapped_column(String(64), index=True, nullable=True)
+    latency_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    tokens_in: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    tokens_out: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    request_payload: Mapped[dict[str, Any]] = mapped_column(FastJSONB)
+    response_payload: Mapped[dict[str, Any]] = mapped_column(FastJSONB)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
 
 __all__ = ["AiTimingHistory"]
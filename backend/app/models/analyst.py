@@ -4,14 +4,28 @@ from __future__ import annotations
 
 from datetime import date
 
-from sqlalchemy import Date, JSON, Numeric, String
+from sqlalchemy import Date, Index, Numeric, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.models._types import FastJSONB
 
 
 class AnalystSnapshot(Base):
     __tablename__ = "analyst_snapshot"
+    __table_args__ = (
+        Index(
+            "ix_analyst_snapshot_payload",
+            "payload",
+            postgresql_using="gin",
+            postgresql_ops={"payload": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_analyst_snapshot_payload_sector",
+            text("(payload -> 'sector') jsonb_path_ops"),
+            postgresql_using="gin",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     symbol: Mapped[str] = mapped_column(String(20), index=True)
@@ -20,7 +34,7 @@ class AnalystSnapshot(Base):
     target_price: Mapped[float | None] = mapped_column(Numeric(18, 6), nullable=True)
     horizon_days: Mapped[int | None] = mapped_column(nullable=True)
     source: Mapped[str | None] = mapped_column(String(64), nullable=True)
-    payload: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    payload: Mapped[dict | None] = mapped_column(FastJSONB, nullable=True)
     verified: Mapped[bool] = mapped_column(default=False)
 
 
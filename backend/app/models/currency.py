@@ -0,0 +1,20 @@
+"""Currency lookup model."""
+
+from __future__ import annotations
+
+from sqlalchemy import CHAR, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class Currency(Base):
+    """ISO-4217 lookup table referenced by the currency columns."""
+
+    __tablename__ = "currency"
+
+    code: Mapped[str] = mapped_column(CHAR(3), primary_key=True)
+    name: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+
+__all__ = ["Currency"]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import date
 
-from sqlalchemy import Date, Float, ForeignKey, Index, Numeric, String, UniqueConstraint
+from sqlalchemy import Date, Float, ForeignKey, Index, Numeric, String, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -13,19 +13,36 @@ from app.db.base import Base
 class DailyBar(Base):
     __tablename__ = "daily_bar"
     __table_args__ = (
-        UniqueConstraint("symbol", "date", name="uq_daily_bar_symbol_date"),
-        Index("ix_daily_bar_symbol_date", "symbol", "date"),
+        # One btree does double duty: enforces (symbol, date) uniqueness for
+        # ON CONFLICT upserts and carries INCLUDE columns so "last N bars" /
+        # "close on date" reads are index-only scans.
+        Index(
+            "ix_daily_bar_symbol_date_covering",
+            "symbol",
+            "date",
+            unique=True,
+            postgresql_include=["adj_close", "close", "volume"],
+        ),
+        Index(
+            "ix_daily_bar_date_brin",
+            "date",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        # Range queries only touch the partitions overlapping the window;
+        # the partition key must be part of the primary key.
+        {"postgresql_partition_by": "RANGE (date)"},
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     symbol: Mapped[str] = mapped_column(String(20))
-    date: Mapped[date] = mapped_column(Date)
-    open: Mapped[float] = mapped_column(Numeric(18, 6))
-    high: Mapped[float] = mapped_column(Numeric(18, 6))
-    low: Mapped[float] = mapped_column(Numeric(18, 6))
-    close: Mapped[float] = mapped_column(Numeric(18, 6))
-    adj_close: Mapped[float] = mapped_column(Numeric(18, 6))
-    volume: Mapped[float] = mapped_column(Numeric(20, 2))
+    date: Mapped[date] = mapped_column(Date, primary_key=True)
+    open: Mapped[float] = mapped_column(Float)
+    high: Mapped[float] = mapped_column(Float)
+    low: Mapped[float] = mapped_column(Float)
+    close: Mapped[float] = mapped_column(Float)
+    adj_close: Mapped[float] = mapped_column(Float)
+    volume: Mapped[float] = mapped_column(Float)
     currency: Mapped[str] = mapped_column(String(3), default="USD")
     split_coefficient: Mapped[float | None] = mapped_column(Float, nullable=True)
     dividend_amount: Mapped[float | None] = mapped_column(Float, nullable=True)
@@ -35,7 +52,13 @@ class FXRate(Base):
     __tablename__ = "fx_rate"
     __table_args__ = (
         UniqueConstraint("date", "from_ccy", "to_ccy", name="uq_fx_rate_date_pair"),
-        Index("ix_fx_rate_pair", "from_ccy", "to_ccy", "date"),
+        Index(
+            "ix_fx_rate_pair",
+            "from_ccy",
+            "to_ccy",
+            "date",
+            postgresql_include=["rate_close"],
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -50,21 +73,24 @@ class DailyPortfolioSnapshot(Base):
     __table_args__ = (
         UniqueConstraint("portfolio_id", "symbol", "date", name="uq_snapshot_symbol_date"),
         Index("ix_snapshot_symbol_date", "portfolio_id", "symbol", "date"),
+        # Mirrors migration 0013: newest-first timeline reads per symbol.
+        Index("ix_snapshot_symbol_date_desc", "symbol", text("date DESC")),
+        {"postgresql_partition_by": "RANGE (date)"},
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     portfolio_id: Mapped[int | None] = mapped_column(ForeignKey("portfolio.id", ondelete="CASCADE"), nullable=True)
     symbol: Mapped[str] = mapped_column(String(20))
-    date: Mapped[date] = mapped_column(Date)
-    shares_open: Mapped[float] = mapped_column(Numeric(18, 6))
-    market_value_base: Mapped[float] = mapped_column(Numeric(18, 6))
-    cost_basis_open_base: Mapped[float] = mapped_column(Numeric(18, 6))
-    unrealized_pl_base: Mapped[float] = mapped_column(Numeric(18, 6))
-    realized_pl_to_date_base: Mapped[float] = mapped_column(Numeric(18, 6))
-    hypo_liquidation_pl_base: Mapped[float] = mapped_column(Numeric(18, 6))
-    day_opportunity_base: Mapped[float] = mapped_column(Numeric(18, 6))
-    peak_hypo_pl_to_date_base: Mapped[float] = mapped_column(Numeric(18, 6))
-    drawdown_from_peak_pct: Mapped[float] = mapped_column(Numeric(10, 4))
+    date: Mapped[date] = mapped_column(Date, primary_key=True)
+    shares_open: Mapped[float] = mapped_column(Float)
+    market_value_base: Mapped[float] = mapped_column(Float)
+    cost_basis_open_base: Mapped[float] = mapped_column(Float)
+    unrealized_pl_base: Mapped[float] = mapped_column(Float)
+    realized_pl_to_date_base: Mapped[float] = mapped_column(Float)
+    hypo_liquidation_pl_base: Mapped[float] = mapped_column(Float)
+    day_opportunity_base: Mapped[float] = mapped_column(Float)
+    peak_hypo_pl_to_date_base: Mapped[float] = mapped_column(Float)
+    drawdown_from_peak_pct: Mapped[float] = mapped_column(Float)
 
 
 __all__ = ["DailyBar", "FXRate", "DailyPortfolioSnapshot"]
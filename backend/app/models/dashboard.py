@@ -4,20 +4,29 @@ from __future__ import annotations
 
 from datetime import date
 
-from sqlalchemy import Date, JSON, Numeric, String
+from sqlalchemy import Date, Index, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.models._types import FastJSONB
 
 
 class DashboardKPI(Base):
     __tablename__ = "dashboard_kpi"
+    __table_args__ = (
+        Index(
+            "ix_dashboard_kpi_payload",
+            "payload",
+            postgresql_using="gin",
+            postgresql_ops={"payload": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     date: Mapped[date] = mapped_column(Date, index=True)
     metric: Mapped[str] = mapped_column(String(64), index=True)
     value: Mapped[float] = mapped_column(Numeric(18, 6))
-    payload: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    payload: Mapped[dict | None] = mapped_column(FastJSONB, nullable=True)
 
 
 __all__ = ["DashboardKPI"]
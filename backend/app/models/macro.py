@@ -4,21 +4,43 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, JSON, Numeric, String
+from sqlalchemy import DateTime, Index, Numeric, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.models._types import FastJSONB
 
 
 class MacroEvent(Base):
     __tablename__ = "macro_event"
+    __table_args__ = (
+        Index(
+            "ix_macro_event_timestamp_utc_brin",
+            "timestamp_utc",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_macro_event_payload",
+            "payload",
+            postgresql_using="gin",
+            postgresql_ops={"payload": "jsonb_path_ops"},
+        ),
+        # Narrow expression index for the one key country filters hit;
+        # queries must use containment (payload->'country' @> '"US"').
+        Index(
+            "ix_macro_event_payload_country",
+            text("(payload -> 'country') jsonb_path_ops"),
+            postgresql_using="gin",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     event_type: Mapped[str] = mapped_column(String(32), index=True)
     title: Mapped[str] = mapped_column(String(128))
-    timestamp_utc: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+    timestamp_utc: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     importance: Mapped[str | None] = mapped_column(String(16), nullable=True)
-    payload: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    payload: Mapped[dict | None] = mapped_column(FastJSONB, nullable=True)
     impact_score: Mapped[float | None] = mapped_column(Numeric(6, 3), nullable=True)
 
 
@@ -12,8 +12,11 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Numeric,
+    SmallInteger,
     String,
+    TypeDecorator,
     UniqueConstraint,
+    func,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -22,6 +25,31 @@ from app.db.base import Base
 TRANSACTION_TYPES = ("BUY", "SELL", "DIVIDEND", "FEE", "SPLIT")
 
 
+class TransactionType(TypeDecorator):
+    """Store the transaction type as a smallint code, exposed as its name.
+
+    A coded smallint is 2 bytes on disk and compares as a plain integer,
+    versus the native enum's 4 bytes plus a catalog lookup, and new types
+    need no transaction-blocking ``ALTER TYPE ... ADD VALUE``.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    _CODES = {name: code for code, name in enumerate(TRANSACTION_TYPES, start=1)}
+    _NAMES = {code: name for name, code in _CODES.items()}
+
+    def process_bind_param(self, value: str | None, dialect: object) -> int | None:
+        if value is None:
+            return None
+        return self._CODES[value]
+
+    def process_result_value(self, value: int | None, dialect: object) -> str | None:
+        if value is None:
+            return None
+        return self._NAMES[value]
+
+
 class Portfolio(Base):
     __tablename__ = "portfolio"
 
@@ -30,8 +58,10 @@ class Portfolio(Base):
     base_currency: Mapped[str] = mapped_column(String(3), default="USD")
     timezone: Mapped[str] = mapped_column(String(64), default="Asia/Dubai")
 
+    # selectin batches child loads into one IN query per level instead of
+    # one lazy SELECT per parent row (N+1) when iterating a portfolio.
     transactions: Mapped[list["Transaction"]] = relationship(
-        back_populates="portfolio", cascade="all, delete-orphan"
+        back_populates="portfolio", cascade="all, delete-orphan", lazy="selectin"
     )
     watchlist: Mapped[list["PortfolioSymbol"]] = relationship(
         back_populates="portfolio", cascade="all, delete-orphan"
@@ -53,8 +83,8 @@ class Transaction(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     portfolio_id: Mapped[int] = mapped_column(ForeignKey("portfolio.id", ondelete="CASCADE"))
-    symbol: Mapped[str] = mapped_column(String(20), index=True)
-    type: Mapped[str] = mapped_column(Enum(*TRANSACTION_TYPES, name="transaction_type"))
+    symbol: Mapped[str] = mapped_column(String(20))
+    type: Mapped[str] = mapped_column("type_code", TransactionType())
     qty: Mapped[float] = mapped_column(Numeric(18, 4))
     price: Mapped[float] = mapped_column(Numeric(18, 6))
     fee: Mapped[float] = mapped_column(Numeric(18, 6), default=0)
@@ -68,7 +98,7 @@ class Transaction(Base):
     notes: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     portfolio: Mapped[Portfolio] = relationship(back_populates="transactions")
-    lots: Mapped[list["Lot"]] = relationship(back_populates="transaction")
+    lots: Mapped[list["Lot"]] = relationship(back_populates="transaction", lazy="selectin")
     account: Mapped[Optional["PortfolioAccount"]] = relationship(back_populates="transactions")
 
 
@@ -82,7 +112,7 @@ class PortfolioSymbol(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     portfolio_id: Mapped[int] = mapped_column(ForeignKey("portfolio.id", ondelete="CASCADE"))
     symbol: Mapped[str] = mapped_column(String(20))
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     display_name: Mapped[str | None] = mapped_column(String(128), nullable=True)
 
     portfolio: Mapped[Portfolio] = relationship(back_populates="watchlist")
@@ -101,7 +131,7 @@ class PortfolioAccount(Base):
     type: Mapped[str | None] = mapped_column(String(32), nullable=True)
     currency: Mapped[str] = mapped_column(String(3), default="USD")
     notes: Mapped[str | None] = mapped_column(String(255), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     is_default: Mapped[bool] = mapped_column(Boolean, default=False)
 
     portfolio: Mapped[Portfolio] = relationship(back_populates="accounts")
@@ -134,13 +164,16 @@ class InvestmentDecision(Base):
     investor: Mapped[str] = mapped_column(String(128))
     symbol: Mapped[str] = mapped_column(String(20), index=True)
     action: Mapped[DecisionAction] = mapped_column(
-        Enum(DecisionAction, name="decision_action"), default=DecisionAction.BUY_MORE
+        # native_enum keeps the column a 4-byte enum OID rather than varchar.
+        Enum(DecisionAction, name="decision_action", native_enum=True),
+        default=DecisionAction.BUY_MORE,
     )
     planned_quantity: Mapped[float | None] = mapped_column(Numeric(18, 4), nullable=True)
     decision_price: Mapped[float | None] = mapped_column(Numeric(18, 6), nullable=True)
-    decision_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    decision_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     status: Mapped[DecisionStatus] = mapped_column(
-        Enum(DecisionStatus, name="decision_status"), default=DecisionStatus.OPEN
+        Enum(DecisionStatus, name="decision_status", native_enum=True),
+        default=DecisionStatus.OPEN,
     )
     resolved_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     resolved_price: Mapped[float | None] = mapped_column(Numeric(18, 6), nullable=True)
@@ -4,22 +4,44 @@ from __future__ import annotations
 
 from datetime import date, datetime
 
-from sqlalchemy import Date, DateTime, JSON, Numeric, String
+from sqlalchemy import Date, DateTime, Index, Numeric, String, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.models._types import FastJSONB
 
 
 class SignalEvent(Base):
     __tablename__ = "signal_event"
+    __table_args__ = (
+        # jsonb_path_ops GIN: serves payload @> containment filters.
+        Index(
+            "ix_signal_event_payload",
+            "payload",
+            postgresql_using="gin",
+            postgresql_ops={"payload": "jsonb_path_ops"},
+        ),
+        # Mirrors migration 0013: (symbol, date DESC) serves "latest signals
+        # for symbol" scans and supersedes a plain symbol btree, and the
+        # partial index covers only rows carrying a cooldown — the subset the
+        # active-signal query has to re-check.
+        Index("ix_signal_event_symbol_date", "symbol", text("date DESC")),
+        Index(
+            "ix_signal_event_cooldown",
+            "symbol",
+            text("date DESC"),
+            "cooldown_until",
+            postgresql_where=text("cooldown_until IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    symbol: Mapped[str] = mapped_column(String(20), index=True)
+    symbol: Mapped[str] = mapped_column(String(20))
     date: Mapped[date] = mapped_column(Date, index=True)
     rule_id: Mapped[str] = mapped_column(String(64), index=True)
     signal_type: Mapped[str] = mapped_column(String(32))
     severity: Mapped[str | None] = mapped_column(String(16), nullable=True)
-    payload: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    payload: Mapped[dict | None] = mapped_column(FastJSONB, nullable=True)
     cooldown_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import date, datetime
 
-from sqlalchemy import Date, DateTime, Index, Numeric, String, UniqueConstraint, func
+from sqlalchemy import Date, DateTime, Float, Index, String, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -22,11 +22,11 @@ class SessionSummary(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     symbol: Mapped[str] = mapped_column(String(20), nullable=False)
     date: Mapped[date] = mapped_column(Date, nullable=False)
-    open: Mapped[float] = mapped_column(Numeric(18, 6), nullable=False)
-    midday_low: Mapped[float] = mapped_column(Numeric(18, 6), nullable=False)
-    close: Mapped[float] = mapped_column(Numeric(18, 6), nullable=False)
-    drawdown_pct: Mapped[float] = mapped_column(Numeric(10, 6), nullable=False)
-    recovery_pct: Mapped[float] = mapped_column(Numeric(10, 6), nullable=False)
+    open: Mapped[float] = mapped_column(Float, nullable=False)
+    midday_low: Mapped[float] = mapped_column(Float, nullable=False)
+    close: Mapped[float] = mapped_column(Float, nullable=False)
+    drawdown_pct: Mapped[float] = mapped_column(Float, nullable=False)
+    recovery_pct: Mapped[float] = mapped_column(Float, nullable=False)
     bars: Mapped[int] = mapped_column(nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
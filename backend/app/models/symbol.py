@@ -0,0 +1,20 @@
+"""Symbol dimension model."""
+
+from __future__ import annotations
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class SymbolDim(Base):
+    """Instrument lookup table referenced by the market-data symbol columns."""
+
+    __tablename__ = "symbol_dim"
+
+    symbol: Mapped[str] = mapped_column(String(20), primary_key=True)
+    name: Mapped[str | None] = mapped_column(String(128), nullable=True)
+
+
+__all__ = ["SymbolDim"]
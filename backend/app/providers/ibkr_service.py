@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from typing import Any, AsyncIterator, Iterable
 
 import httpx
+import orjson
 
 from app.config import get_settings
 from app.schemas.symbols import SymbolSearchResultSchema
@@ -14,6 +16,107 @@ class IBKRServiceError(RuntimeError):
     """Raised when the IBKR microservice returns an error."""
 
 
+# Shared client for the configured service URL so symbol searches and bar
+# fetches reuse keep-alive connections instead of paying a TCP/TLS handshake
+# per call. Created lazily on first use; closed from the lifespan hook.
+_client: httpx.AsyncClient | None = None
+
+# Service URL resolved from settings once, so the hot path skips the
+# get_settings() call and rstrip per request. reset_ibkr_base_url() clears
+# it for tests that repoint the service.
+_url_base: str | None = None
+
+
+def _resolve_url_base() -> str:
+    global _url_base
+    if _url_base is None:
+        _url_base = (get_settings().ibkr_service_url or "").rstrip("/")
+    return _url_base
+
+
+def reset_ibkr_base_url() -> None:
+    """Forget the cached service URL (test hook)."""
+
+    global _url_base
+    _url_base = None
+
+
+def _get_client(url_base: str) -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed or str(_client.base_url).rstrip("/") != url_base:
+        # The bridge speaks HTTP/1.1, so a generous keep-alive pool is what
+        # amortizes handshakes across the bursts of fetch_price_bars calls
+        # behind a portfolio sync; the transport retries connect failures
+        # so a recycled idle socket does not surface as an error.
+        _client = httpx.AsyncClient(
+            base_url=url_base,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(15.0, connect=5.0),
+            transport=httpx.AsyncHTTPTransport(retries=2),
+        )
+    return _client
+
+
+async def aclose_ibkr_client() -> None:
+    """Close the shared HTTP client on application shutdown."""
+
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+
+
+async def _request(
+    method: str,
+    path: str,
+    *,
+    base_url: str | None,
+    timeout_seconds: float,
+    **kwargs: Any,
+) -> httpx.Response:
+    """Issue a request on the shared client, or a one-shot client when the
+    caller overrides ``base_url`` (tests point it at ad-hoc servers)."""
+
+    url_base = base_url.rstrip("/") if base_url else _resolve_url_base()
+    if not url_base:
+        raise IBKRServiceError("IBKR service URL is not configured")
+    try:
+        if base_url:
+            async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+                return await client.request(method, f"{url_base}{path}", **kwargs)
+        client = _get_client(url_base)
+        return await client.request(
+            method, path, timeout=httpx.Timeout(timeout_seconds, connect=5.0), **kwargs
+        )
+    except httpx.HTTPError as exc:  # pragma: no cover - network failure handling
+        raise IBKRServiceError(f"Failed to reach IBKR service: {exc}") from exc
+
+
+def _parse_json(response: httpx.Response) -> Any:
+    """Decode a response body with orjson.
+
+    Bar payloads are long arrays of numeric-heavy dicts where orjson decodes
+    several times faster than the stdlib parser behind ``response.json()``.
+    Stubbed responses in tests may not carry raw ``content``; fall back to
+    ``.json()`` for those.
+    """
+
+    content = getattr(response, "content", None)
+    if content is not None:
+        return orjson.loads(content)
+    return response.json()
+
+
+def _error_detail(response: httpx.Response) -> Any:
+    try:
+        payload = _parse_json(response)
+        return payload.get("detail", payload)
+    except Exception:  # pragma: no cover - defensive parsing
+        return response.text
+
+
 async def search_symbols(
     query: str,
     *,
@@ -22,28 +125,21 @@ async def search_symbols(
 ) -> list[SymbolSearchResultSchema]:
     """Call the IBKR service search endpoint and normalize results."""
 
-    settings = get_settings()
-    url_base = (base_url or settings.ibkr_service_url or "").rstrip("/")
-    if not url_base:
-        raise IBKRServiceError("IBKR service URL is not configured")
-    url = f"{url_base}/symbols/search"
-    try:
-        async with httpx.AsyncClient(timeout=timeout_seconds) as client:
-            response = await client.get(url, params={"query": query})
-    except httpx.HTTPError as exc:  # pragma: no cover - network failure handling
-        raise IBKRServiceError(f"Failed to reach IBKR service: {exc}") from exc
+    response = await _request(
+        "GET",
+        "/symbols/search",
+        base_url=base_url,
+        timeout_seconds=timeout_seconds,
+        params={"query": query},
+    )
 
     if response.status_code >= 400:
-        detail: Any
-        try:
-            payload = response.json()
-            detail = payload.get("detail", payload)
-        except Exception:  # pragma: no cover - defensive parsing
-            detail = response.text
-        raise IBKRServiceError(f"IBKR service error {response.status_code}: {detail}")
+        raise IBKRServiceError(
+            f"IBKR service error {response.status_code}: {_error_detail(response)}"
+        )
 
     try:
-        payload = response.json()
+        payload = _parse_json(response)
     except ValueError as exc:
         raise IBKRServiceError("IBKR service returned invalid JSON payload") from exc
 
@@ -57,22 +153,34 @@ async def search_symbols(
         raise IBKRServiceError("IBKR service response is not a list of results")
 
     results: list[SymbolSearchResultSchema] = []
+    append = results.append
+    construct = SymbolSearchResultSchema.model_construct
     for item in matches:
-        if not isinstance(item, dict):
+        # One bound .get stands in for the isinstance gate and the repeated
+        # method lookups; non-dict items simply have no get attribute.
+        get = getattr(item, "get", None)
+        if get is None:
             continue
-        raw_symbol = item.get("symbol") or item.get("ticker") or ""
-        symbol = str(raw_symbol).strip().upper()
+        raw_symbol = get("symbol") or get("ticker") or ""
+        symbol = (
+            raw_symbol.strip().upper()
+            if isinstance(raw_symbol, str)
+            else str(raw_symbol).strip().upper()
+        )
         if not symbol:
             continue
-        name_value = item.get("name") or raw_symbol or symbol
-        schema = SymbolSearchResultSchema(
-            symbol=symbol,
-            name=str(name_value),
-            region=item.get("region"),
-            currency=item.get("currency"),
-            match_score=item.get("match_score"),
+        # model_construct skips per-field validation; every value here was
+        # just normalized above, so the validators would only re-check our
+        # own output on what can be a large result list.
+        append(
+            construct(
+                symbol=symbol,
+                name=str(get("name") or raw_symbol or symbol),
+                region=get("region"),
+                currency=get("currency"),
+                match_score=get("match_score"),
+            )
         )
-        results.append(schema)
     return results
 
 
@@ -87,11 +195,6 @@ async def fetch_price_bars(
 ) -> list[dict[str, Any]]:
     """Fetch raw bar payloads from the IBKR bridge."""
 
-    settings = get_settings()
-    url_base = (base_url or settings.ibkr_service_url or "").rstrip("/")
-    if not url_base:
-        raise IBKRServiceError("IBKR service URL is not configured")
-    url = f"{url_base}/prices"
     params: dict[str, Any] = {}
     if bar_size:
         params["bar_size"] = bar_size
@@ -99,23 +202,22 @@ async def fetch_price_bars(
         params["duration_days"] = duration_days
     if use_rth is not None:
         params["use_rth"] = use_rth
-    try:
-        async with httpx.AsyncClient(timeout=timeout_seconds) as client:
-            response = await client.post(url, params=params, json={"symbol": symbol})
-    except httpx.HTTPError as exc:  # pragma: no cover - network failure handling
-        raise IBKRServiceError(f"Failed to reach IBKR service: {exc}") from exc
+    response = await _request(
+        "POST",
+        "/prices",
+        base_url=base_url,
+        timeout_seconds=timeout_seconds,
+        params=params,
+        json={"symbol": symbol},
+    )
 
     if response.status_code >= 400:
-        detail: Any
-        try:
-            payload = response.json()
-            detail = payload.get("detail", payload)
-        except Exception:  # pragma: no cover - defensive parsing
-            detail = response.text
-        raise IBKRServiceError(f"IBKR service error {response.status_code}: {detail}")
+        raise IBKRServiceError(
+            f"IBKR service error {response.status_code}: {_error_detail(response)}"
+        )
 
     try:
-        payload = response.json()
+        payload = _parse_json(response)
     except ValueError as exc:
         raise IBKRServiceError("IBKR service returned invalid JSON payload") from exc
 
@@ -130,4 +232,99 @@ async def fetch_price_bars(
     return bars
 
 
-__all__ = ["IBKRServiceError", "search_symbols", "fetch_price_bars"]
+async def stream_price_bars(
+    symbol: str,
+    *,
+    base_url: str | None = None,
+    bar_size: str | None = None,
+    duration_days: int | None = None,
+    use_rth: bool | None = None,
+    timeout_seconds: float = 15.0,
+) -> AsyncIterator[dict[str, Any]]:
+    """Yield bar payloads from the IBKR bridge one dict at a time.
+
+    Multi-year intraday responses run to tens of MB; streaming reads the
+    body into a single contiguous bytes buffer and hands out bars as they
+    are consumed, instead of holding the buffer, httpx's decoded str, and
+    the full bar list alive at once as ``fetch_price_bars`` does.
+    """
+
+    params: dict[str, Any] = {}
+    if bar_size:
+        params["bar_size"] = bar_size
+    if duration_days:
+        params["duration_days"] = duration_days
+    if use_rth is not None:
+        params["use_rth"] = use_rth
+    url_base = base_url.rstrip("/") if base_url else _resolve_url_base()
+    if not url_base:
+        raise IBKRServiceError("IBKR service URL is not configured")
+    try:
+        if base_url:
+            async with httpx.AsyncClient(timeout=timeout_seconds) as client:
+                async with client.stream(
+                    "POST", f"{url_base}/prices", params=params, json={"symbol": symbol}
+                ) as response:
+                    body = await response.aread()
+        else:
+            async with _get_client(url_base).stream(
+                "POST",
+                "/prices",
+                params=params,
+                json={"symbol": symbol},
+                timeout=httpx.Timeout(timeout_seconds, connect=5.0),
+            ) as response:
+                body = await response.aread()
+    except httpx.HTTPError as exc:  # pragma: no cover - network failure handling
+        raise IBKRServiceError(f"Failed to reach IBKR service: {exc}") from exc
+
+    if response.status_code >= 400:
+        raise IBKRServiceError(
+            f"IBKR service error {response.status_code}: {_error_detail(response)}"
+        )
+    try:
+        payload = orjson.loads(body)
+    except ValueError as exc:
+        raise IBKRServiceError("IBKR service returned invalid JSON payload") from exc
+
+    bars = payload.get("bars", []) if isinstance(payload, dict) else payload
+    if not isinstance(bars, list):
+        raise IBKRServiceError("IBKR service response is not a list of bars")
+    for bar in bars:
+        yield bar
+
+
+async def fetch_price_bars_many(
+    symbols: Iterable[str],
+    *,
+    concurrency: int = 8,
+    **kwargs: Any,
+) -> dict[str, list[dict[str, Any]] | IBKRServiceError]:
+    """Fetch bars for many symbols concurrently over the shared client.
+
+    Requests overlap up to ``concurrency`` in flight, so wall time is close
+    to the slowest single fetch rather than the sum. A failed symbol maps to
+    its :class:`IBKRServiceError` instead of failing the whole batch.
+    """
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_one(symbol: str) -> tuple[str, list[dict[str, Any]] | IBKRServiceError]:
+        async with semaphore:
+            try:
+                return symbol, await fetch_price_bars(symbol, **kwargs)
+            except IBKRServiceError as exc:
+                return symbol, exc
+
+    return dict(await asyncio.gather(*(fetch_one(symbol) for symbol in symbols)))
+
+
+__all__ = [
+    "IBKRServiceError",
+    "aclose_ibkr_client",
+    "reset_ibkr_base_url",
+    "search_symbols",
+    "fetch_price_bars",
+    "fetch_price_bars_many",
+    "stream_price_bars",
+]
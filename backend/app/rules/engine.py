@@ -2,25 +2,50 @@
 
 from __future__ import annotations
 
+import operator
+import weakref
 from dataclasses import dataclass
-from datetime import date, timedelta
-from typing import Any, Iterable, List
-
-import pandas as pd
+from datetime import date
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List
 
 from app.schemas.signals import SignalRuleDefinition
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import numpy as np
+    import pandas as pd
+
+
+def _load_numerics() -> None:
+    """Import numpy/pandas on first evaluation rather than at module load.
+
+    pandas costs roughly 200ms and 50MB per process; workers that never
+    evaluate a rule (most API traffic) should not pay that at boot.
+    """
+
+    if "pd" in globals():
+        return
+    import numpy
+    import pandas
+
+    globals()["np"] = numpy
+    globals()["pd"] = pandas
+
+
+# operator.* are C functions: no Python frame per comparison, and they still
+# dispatch to Series/ndarray dunders for array operands.
 COMPARATORS = {
-    ">": lambda lhs, rhs: lhs > rhs,
-    ">=": lambda lhs, rhs: lhs >= rhs,
-    "<": lambda lhs, rhs: lhs < rhs,
-    "<=": lambda lhs, rhs: lhs <= rhs,
-    "==": lambda lhs, rhs: lhs == rhs,
-    "!=": lambda lhs, rhs: lhs != rhs,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
 }
 
 
-@dataclass
+# One instance per trigger, thousands per rules sweep: slots drops the
+# per-instance __dict__ and frozen makes sharing across consumers safe.
+@dataclass(slots=True, frozen=True)
 class SignalCandidate:
     symbol: str
     rule_id: str
@@ -34,23 +59,35 @@ def _resolve_value(df: pd.DataFrame, token: Any) -> Any:
     return token
 
 
-def _evaluate_expression(df: pd.DataFrame, expression: dict[str, Any]) -> pd.Series:
+def _as_bool_array(df: pd.DataFrame, clause: Any) -> np.ndarray:
+    if isinstance(clause, dict):
+        return _evaluate_expression(df, clause)
+    return np.full(len(df), bool(clause), dtype=bool)
+
+
+def _evaluate_expression(df: pd.DataFrame, expression: dict[str, Any]) -> np.ndarray:
+    """Evaluate a rule expression to a boolean ndarray aligned with ``df``.
+
+    ``all``/``any`` fold each clause into a single preallocated bool buffer
+    instead of concatenating per-clause Series into a DataFrame, and stop
+    early once the accumulator is decided.
+    """
+
+    _load_numerics()
     if "all" in expression:
-        series = [
-            _evaluate_expression(df, clause)
-            if isinstance(clause, dict)
-            else clause
-            for clause in expression["all"]
-        ]
-        return pd.concat(series, axis=1).all(axis=1)
+        acc = np.ones(len(df), dtype=bool)
+        for clause in expression["all"]:
+            acc &= _as_bool_array(df, clause)
+            if not acc.any():
+                break
+        return acc
     if "any" in expression:
-        series = [
-            _evaluate_expression(df, clause)
-            if isinstance(clause, dict)
-            else clause
-            for clause in expression["any"]
-        ]
-        return pd.concat(series, axis=1).any(axis=1)
+        acc = np.zeros(len(df), dtype=bool)
+        for clause in expression["any"]:
+            acc |= _as_bool_array(df, clause)
+            if acc.all():
+                break
+        return acc
     if "not" in expression:
         return ~_evaluate_expression(df, expression["not"])
     indicator = expression.get("indicator")
@@ -61,48 +98,257 @@ def _evaluate_expression(df: pd.DataFrame, expression: dict[str, Any]) -> pd.Ser
     lhs = _resolve_value(df, indicator)
     rhs = _resolve_value(df, value)
     comparator = COMPARATORS[op]
-    if isinstance(lhs, pd.Series) and isinstance(rhs, pd.Series):
-        return comparator(lhs, rhs)
-    if isinstance(lhs, pd.Series):
-        return comparator(lhs, rhs)
-    if isinstance(rhs, pd.Series):
-        return comparator(lhs, rhs)
-    return pd.Series([comparator(lhs, rhs)] * len(df), index=df.index)
+    if isinstance(lhs, pd.Series) or isinstance(rhs, pd.Series):
+        # NaN comparisons are False, so this is also the fillna(False) step.
+        return np.asarray(comparator(lhs, rhs), dtype=bool)
+    return np.full(len(df), bool(comparator(lhs, rhs)), dtype=bool)
+
+
+# Compiled form of a rule expression: DataFrame in, aligned bool mask out.
+CompiledExpression = Callable[["pd.DataFrame"], "np.ndarray"]
+
+
+def compile_expression(expression: dict[str, Any]) -> CompiledExpression:
+    """Specialize a rule expression into a closure, walking the dict once.
+
+    The interpreter in :func:`_evaluate_expression` re-dispatches on
+    ``all``/``any``/``not`` and re-reads the leaf keys for every evaluation;
+    compiling resolves comparators and literal operands up front so reuse
+    across symbols only pays for the comparisons themselves.
+    """
+
+    _load_numerics()
+    if "all" in expression:
+        fused = _fuse_scalar_leaves(expression["all"], absorbing=False)
+        if fused is not None:
+            return fused
+        children = _compile_children(expression["all"], absorbing=False)
+        if not isinstance(children, tuple):
+            return children
+
+        def _eval_all(df: pd.DataFrame) -> np.ndarray:
+            acc = np.ones(len(df), dtype=bool)
+            for child in children:
+                acc &= child(df)
+                if not acc.any():
+                    break
+            return acc
+
+        return _eval_all
+    if "any" in expression:
+        fused = _fuse_scalar_leaves(expression["any"], absorbing=True)
+        if fused is not None:
+            return fused
+        children = _compile_children(expression["any"], absorbing=True)
+        if not isinstance(children, tuple):
+            return children
+
+        def _eval_any(df: pd.DataFrame) -> np.ndarray:
+            acc = np.zeros(len(df), dtype=bool)
+            for child in children:
+                acc |= child(df)
+                if acc.all():
+                    break
+            return acc
+
+        return _eval_any
+    if "not" in expression:
+        child = compile_expression(expression["not"])
+        return lambda df: ~child(df)
+    indicator = expression.get("indicator")
+    op = expression.get("op")
+    value = expression.get("value")
+    if indicator is None or op not in COMPARATORS:
+        raise ValueError(f"Invalid rule expression leaf: {expression}")
+    comparator = COMPARATORS[op]
+    # Strings may name a column and can only be resolved against a concrete
+    # frame; anything else is a literal, so the comparison folds right here.
+    if not isinstance(indicator, str) and not isinstance(value, str):
+        return _compile_constant(comparator(indicator, value))
+
+    def _eval_leaf(df: pd.DataFrame) -> np.ndarray:
+        lhs = _resolve_value(df, indicator)
+        rhs = _resolve_value(df, value)
+        # Series-vs-scalar drops to the raw ndarray so the comparison skips
+        # the Series wrapper and alignment machinery entirely; NaN
+        # comparisons are False either way, which is the fillna(False) step.
+        if isinstance(lhs, pd.Series) and not isinstance(rhs, pd.Series):
+            return np.asarray(comparator(lhs.to_numpy(), rhs), dtype=bool)
+        if isinstance(lhs, pd.Series) or isinstance(rhs, pd.Series):
+            return np.asarray(comparator(lhs, rhs), dtype=bool)
+        return np.full(len(df), bool(comparator(lhs, rhs)), dtype=bool)
+
+    return _eval_leaf
+
+
+def _compile_constant(clause: Any) -> CompiledExpression:
+    value = bool(clause)
+
+    def _const(df: pd.DataFrame) -> np.ndarray:
+        return np.full(len(df), value, dtype=bool)
+
+    # Marks the closure as constant so parent nodes can fold it away.
+    _const._constant = value  # type: ignore[attr-defined]
+    return _const
+
+
+def _clause_cost(clause: Any) -> int:
+    """Rank a clause so cheap, likely-selective ones evaluate first.
+
+    ``all``/``any`` are commutative, so children can be reordered freely to
+    feed the short-circuit in the accumulator loop: constants are free,
+    column-vs-scalar comparisons filter hardest for the least work, and
+    nested expressions or series-vs-series comparisons go last.
+    """
+
+    if not isinstance(clause, dict):
+        return 0
+    if "indicator" in clause and not isinstance(clause.get("value"), str):
+        return 1
+    return 2
+
+
+def _fuse_scalar_leaves(
+    clauses: list[Any], *, absorbing: bool
+) -> CompiledExpression | None:
+    """Fuse an ``all``/``any`` node of pure column-vs-scalar leaves.
+
+    This is the dominant rule shape (several thresholds on indicator
+    columns). Instead of one closure call per child, the node compiles to a
+    single loop over precaptured (column, comparator, threshold) triples
+    working on raw ndarrays — the decision-table kernel, minus the JIT,
+    since numba is not a dependency of this service.
+    """
+
+    if len(clauses) < 2:
+        return None
+    specs: list[tuple[str, Callable[[Any, Any], Any], Any]] = []
+    for clause in clauses:
+        if not isinstance(clause, dict) or "indicator" not in clause:
+            return None
+        indicator = clause.get("indicator")
+        op = clause.get("op")
+        value = clause.get("value")
+        if not isinstance(indicator, str) or isinstance(value, str) or op not in COMPARATORS:
+            return None
+        specs.append((indicator, COMPARATORS[op], value))
+    triples = tuple(specs)
+
+    def _eval_fused(df: pd.DataFrame) -> np.ndarray:
+        acc = np.full(len(df), not absorbing, dtype=bool)
+        for name, comparator, threshold in triples:
+            column = df.get(name)
+            if column is None:
+                # Name is not a column: same literal-vs-literal semantics
+                # as the interpreter's _resolve_value fallback.
+                if bool(comparator(name, threshold)) is absorbing:
+                    acc[:] = absorbing
+                    break
+                continue
+            result = np.asarray(comparator(column.to_numpy(), threshold), dtype=bool)
+            if absorbing:
+                acc |= result
+                if acc.all():
+                    break
+            else:
+                acc &= result
+                if not acc.any():
+                    break
+        return acc
+
+    return _eval_fused
+
+
+def _compile_children(
+    clauses: list[Any], *, absorbing: bool
+) -> tuple[CompiledExpression, ...] | CompiledExpression:
+    """Compile the children of an ``all``/``any`` node, folding constants.
+
+    ``absorbing`` is the constant that decides the node outright (False for
+    ``all``, True for ``any``); an identity-valued constant child
+    contributes nothing and is dropped. When folding consumes everything,
+    the node itself collapses to a constant closure.
+    """
+
+    ordered = sorted(clauses, key=_clause_cost)
+    compiled: list[CompiledExpression] = []
+    for clause in ordered:
+        child = (
+            compile_expression(clause) if isinstance(clause, dict) else _compile_constant(clause)
+        )
+        constant = getattr(child, "_constant", None)
+        if constant is None:
+            compiled.append(child)
+        elif constant is absorbing:
+            return _compile_constant(absorbing)
+    if not compiled:
+        return _compile_constant(not absorbing)
+    return tuple(compiled)
+
+
+# Keyed by id(rule); weakref.finalize evicts the entry when the rule
+# definition is collected, so stale ids are never reused against a cached
+# compilation of a different rule.
+_compiled_rules: dict[int, CompiledExpression] = {}
+
+
+def compile_rule(rule: SignalRuleDefinition) -> CompiledExpression:
+    """Return the compiled expression for ``rule``, compiling at most once."""
+
+    key = id(rule)
+    compiled = _compiled_rules.get(key)
+    if compiled is None:
+        compiled = compile_expression(rule.expression)
+        _compiled_rules[key] = compiled
+        weakref.finalize(rule, _compiled_rules.pop, key, None)
+    return compiled
 
 
 def evaluate_rule(symbol: str, df: pd.DataFrame, rule: SignalRuleDefinition) -> List[SignalCandidate]:
     """Evaluate a single rule over indicator dataframe."""
 
-    mask = _evaluate_expression(df, rule.expression)
-    mask = mask.fillna(False)
+    _load_numerics()
+    mask = compile_rule(rule)(df)
+    trigger_positions = np.flatnonzero(mask)
+    if trigger_positions.size == 0:
+        return []
+    # Normalize the index once — callers pass frames indexed by Timestamps,
+    # date objects, or strings — then derive integer day offsets since the
+    # UNIX epoch for the cooldown math and the dates materialized in one C
+    # loop (DatetimeIndex.date), so accepted triggers are a plain array
+    # dereference, not a per-row Timestamp-to-date conversion.
+    dt_index = pd.DatetimeIndex(df.index)
+    day_offsets = dt_index.values.astype("datetime64[D]").astype(np.int64)
+    index_dates = dt_index.date
     cooldown = rule.cooldown_days
-    cooldown_until: date | None = None
+    next_allowed = np.iinfo(np.int64).min
+    # Identical for every trigger of this rule, so one dict is shared by all
+    # candidates; SignalCandidate is frozen and consumers treat it as
+    # read-only.
+    payload = {"rule_id": rule.rule_id, "symbol": symbol}
     candidates: list[SignalCandidate] = []
-    for idx, triggered in mask.items():
-        if not triggered:
+    for position in trigger_positions:
+        day = day_offsets[position]
+        if day < next_allowed:
             continue
-        trigger_date = pd.to_datetime(idx).date()
-        if cooldown_until and trigger_date <= cooldown_until:
-            continue
-        cooldown_until = trigger_date + timedelta(days=cooldown)
-        payload = {"rule_id": rule.rule_id, "symbol": symbol}
+        next_allowed = day + cooldown + 1
+        trigger_date = index_dates[position]
         candidates.append(SignalCandidate(symbol=symbol, rule_id=rule.rule_id, date=trigger_date, payload=payload))
     return candidates
 
 
 def evaluate_rules(symbol: str, df: pd.DataFrame, rules: Iterable[SignalRuleDefinition]) -> List[SignalCandidate]:
-    """Evaluate multiple rules and return deduplicated candidates."""
+    """Evaluate multiple rules and return their candidates.
+
+    (rule_id, date) pairs are unique by construction: the cooldown scan in
+    :func:`evaluate_rule` never emits the same date twice for one rule, even
+    with cooldown 0, so no dedup pass is needed here.
+    """
 
-    seen: set[tuple[str, date]] = set()
     results: list[SignalCandidate] = []
     for rule in rules:
-        for candidate in evaluate_rule(symbol, df, rule):
-            key = (rule.rule_id, candidate.date)
-            if key in seen:
-                continue
-            seen.add(key)
-            results.append(candidate)
+        results.extend(evaluate_rule(symbol, df, rule))
     return results
 
 
-__all__ = ["evaluate_rule", "evaluate_rules", "SignalCandidate"]
+__all__ = ["compile_expression", "compile_rule", "evaluate_rule", "evaluate_rules", "SignalCandidate"]
@@ -19,6 +19,7 @@ from .signals import (
     GapDownBacktestStatsSchema,
 )
 from .snapshots import (
+    SNAPSHOT_LIST_ADAPTER,
     DailyPortfolioSnapshotSchema,
     TimelinePricePointSchema,
     TimelineResponse,
@@ -50,6 +51,7 @@ __all__ = [
     "GapDownSignalSchema",
     "GapDownBacktestStatsSchema",
     "DailyPortfolioSnapshotSchema",
+    "SNAPSHOT_LIST_ADAPTER",
     "TimelinePricePointSchema",
     "TimelineResponse",
     "TimelineTransactionSchema",
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import date, datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.models.portfolio import TRANSACTION_TYPES
 
@@ -44,22 +44,8 @@ class TransactionCreateRequest(BaseModel):
 
 
 class TransactionSchema(BaseModel):
-    id: int
-    symbol: str
-    type: str
-    quantity: float
-    price: float
-    fee: float
-    tax: float
-    currency: str
-    trade_datetime: datetime
-    account_id: int | None = None
-    account: str | None = None
-    notes: str | None = None
-    notional_value: float
-
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "symbol": "PATH",
@@ -76,6 +62,21 @@ class TransactionSchema(BaseModel):
                 "notional_value": 1050.0,
             }
         }
+    )
+
+    id: int
+    symbol: str
+    type: str
+    quantity: float
+    price: float
+    fee: float
+    tax: float
+    currency: str
+    trade_datetime: datetime
+    account_id: int | None = None
+    account: str | None = None
+    notes: str | None = None
+    notional_value: float
 
 
 class PortfolioAccountCreateRequest(BaseModel):
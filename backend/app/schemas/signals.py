@@ -5,20 +5,12 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SignalEventSchema(BaseModel):
-    id: int
-    symbol: str
-    date: date
-    rule_id: str
-    signal_type: str
-    severity: Optional[str] = None
-    payload: Optional[dict[str, Any]] = None
-
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "symbol": "PATH",
@@ -29,6 +21,15 @@ class SignalEventSchema(BaseModel):
                 "payload": {"price": 17.45},
             }
         }
+    )
+
+    id: int
+    symbol: str
+    date: date
+    rule_id: str
+    signal_type: str
+    severity: Optional[str] = None
+    payload: Optional[dict[str, Any]] = None
 
 
 class SignalRuleDefinition(BaseModel):
@@ -40,10 +41,8 @@ class SignalRuleDefinition(BaseModel):
 
 
 class SignalRuleUpsertRequest(BaseModel):
-    rules: list[SignalRuleDefinition]
-
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "rules": [
                     {
@@ -61,6 +60,9 @@ class SignalRuleUpsertRequest(BaseModel):
                 ]
             }
         }
+    )
+
+    rules: list[SignalRuleDefinition]
 
 
 class GapDownSignalSchema(BaseModel):
@@ -5,24 +5,12 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class DailyPortfolioSnapshotSchema(BaseModel):
-    symbol: str = Field(..., examples=["PATH"])
-    date: date
-    shares_open: float
-    market_value_base: float
-    cost_basis_open_base: float
-    unrealized_pl_base: float
-    realized_pl_to_date_base: float
-    hypo_liquidation_pl_base: float
-    day_opportunity_base: float
-    peak_hypo_pl_to_date_base: float
-    drawdown_from_peak_pct: float
-
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "symbol": "PATH",
                 "date": "2024-09-10",
@@ -37,6 +25,24 @@ class DailyPortfolioSnapshotSchema(BaseModel):
                 "drawdown_from_peak_pct": 0.0,
             }
         }
+    )
+
+    symbol: str = Field(..., examples=["PATH"])
+    date: date
+    shares_open: float
+    market_value_base: float
+    cost_basis_open_base: float
+    unrealized_pl_base: float
+    realized_pl_to_date_base: float
+    hypo_liquidation_pl_base: float
+    day_opportunity_base: float
+    peak_hypo_pl_to_date_base: float
+    drawdown_from_peak_pct: float
+
+
+# Validates a whole list of snapshot dicts in one core-schema call instead
+# of paying per-field dispatch for each row constructed in a comprehension.
+SNAPSHOT_LIST_ADAPTER = TypeAdapter(list[DailyPortfolioSnapshotSchema])
 
 
 class TimelinePricePointSchema(BaseModel):
@@ -75,6 +81,7 @@ class TopMissedDaySchema(BaseModel):
 
 __all__ = [
     "DailyPortfolioSnapshotSchema",
+    "SNAPSHOT_LIST_ADAPTER",
     "TimelinePricePointSchema",
     "TimelineTransactionSchema",
     "TimelineResponse",
@@ -1,16 +1,10 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 
 class SymbolSearchResultSchema(BaseModel):
-    symbol: str = Field(..., examples=["PATH"])
-    name: str
-    region: Optional[str] = None
-    currency: Optional[str] = None
-    match_score: Optional[float] = None
-
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "symbol": "MSFT",
                 "name": "Microsoft Corporation",
@@ -19,6 +13,13 @@ class SymbolSearchResultSchema(BaseModel):
                 "match_score": 1.0,
             }
         }
+    )
+
+    symbol: str = Field(..., examples=["PATH"])
+    name: str
+    region: Optional[str] = None
+    currency: Optional[str] = None
+    match_score: Optional[float] = None
 
 
 class SymbolRefreshResponse(BaseModel):
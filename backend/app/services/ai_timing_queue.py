@@ -0,0 +1,114 @@
+"""Write-behind queue for AiTimingHistory rows.
+
+Every AI timing call persists two large JSONB payloads; committing them
+inline puts a synchronous WAL flush and TOAST compression on the response
+path. Rows are queued in-process instead and a background task flushes up
+to 500 of them (or whatever arrived within a second) as one multi-row
+insert, so the user-visible request never blocks on the commit.
+
+``created_at`` is filled by the server default, so queued rows carry no
+timestamp and the multi-row insert stays narrow.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+from sqlalchemy import insert
+
+from app.db.session import _session_factory
+from app.models.ai_timing import AiTimingHistory
+
+logger = logging.getLogger(__name__)
+
+_FLUSH_MAX_ROWS = 500
+_FLUSH_INTERVAL_SECONDS = 1.0
+_STOP = object()
+
+_queue: asyncio.Queue[Any] = asyncio.Queue()
+_task: asyncio.Task | None = None
+
+
+def enqueue_history(row: dict[str, Any]) -> bool:
+    """Queue a history row for background insertion.
+
+    Returns False when the flusher is not running (scripts, tests), in
+    which case the caller should write synchronously instead.
+    """
+
+    if _task is None or _task.done():
+        return False
+    _queue.put_nowait(row)
+    return True
+
+
+def start_history_flusher() -> None:
+    """Start the background flush task (idempotent)."""
+
+    global _task
+    if _task is None or _task.done():
+        _task = asyncio.get_running_loop().create_task(_flusher())
+
+
+async def stop_history_flusher() -> None:
+    """Drain outstanding rows and stop the flush task."""
+
+    global _task
+    if _task is None:
+        return
+    _queue.put_nowait(_STOP)
+    await _task
+    _task = None
+
+
+async def _flusher() -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        item = await _queue.get()
+        if item is _STOP:
+            await _flush(_drain())
+            return
+        rows = [item]
+        deadline = loop.time() + _FLUSH_INTERVAL_SECONDS
+        stopping = False
+        while len(rows) < _FLUSH_MAX_ROWS:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(_queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if item is _STOP:
+                stopping = True
+                break
+            rows.append(item)
+        await _flush(rows)
+        if stopping:
+            await _flush(_drain())
+            return
+
+
+def _drain() -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    while not _queue.empty():
+        item = _queue.get_nowait()
+        if item is not _STOP:
+            rows.append(item)
+    return rows
+
+
+async def _flush(rows: list[dict[str, Any]]) -> None:
+    if not rows:
+        return
+    try:
+        async with _session_factory() as session:
+            await session.execute(insert(AiTimingHistory), rows)
+            await session.commit()
+    except Exception:  # pragma: no cover - defensive
+        logger.exception("Failed to flush %d AI timing history rows.", len(rows))
+
+
+__all__ = ["enqueue_history", "start_history_flusher", "stop_history_flusher"]
@@ -2,54 +2,100 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime
-from typing import Any
-
-import httpx
+import asyncio
+from datetime import date
+from functools import lru_cache
+from typing import Any, Sequence
 
+import numpy as np
 import pandas as pd
 
 from app.config import get_settings
 from app.providers.alpha_vantage import AlphaVantageClient
+from app.providers.ibkr_service import IBKRServiceError, fetch_price_bars
+
+
+_OHLC_COLUMNS = ("Open", "High", "Low", "Close", "Adj Close", "Volume")
+
+
+# Daily bars change at most once per trading day, but snapshot rebuilds can
+# request the same symbol several times in a burst. Parsed frames are kept
+# per (symbol, source/output size, calendar day); embedding the day in the
+# key makes entries expire naturally at date rollover. lru_cache cannot be
+# used here because the loaders are async and DataFrames are unhashable.
+_OHLC_CACHE: dict[tuple[str, str, date], pd.DataFrame] = {}
+_OHLC_CACHE_MAX = 256
+
+
+def _ohlc_cache_put(key: tuple[str, str, date], df: pd.DataFrame) -> None:
+    while len(_OHLC_CACHE) >= _OHLC_CACHE_MAX:
+        _OHLC_CACHE.pop(next(iter(_OHLC_CACHE)))
+    _OHLC_CACHE[key] = df
+
+
+@lru_cache(maxsize=65536)
+def _parse_bar_date(raw: str) -> np.datetime64:
+    """Parse a bar date string, memoized across calls.
+
+    pd.to_datetime dispatches through tslibs per call; repeated snapshot
+    rebuilds parse the same date strings over and over, so each unique
+    string is paid for once.
+    """
+
+    return pd.to_datetime(raw).to_datetime64()
+
+
+def _build_frame(dates: np.ndarray, values: np.ndarray, count: int) -> pd.DataFrame:
+    """Assemble the OHLC frame from preallocated typed arrays.
+
+    The arrays carry their dtypes, so pandas skips per-column inference, and
+    one stable argsort replaces the post-hoc sort_index.
+    """
+
+    if count == 0:
+        return pd.DataFrame()
+    order = np.argsort(dates[:count], kind="stable")
+    index = pd.DatetimeIndex(dates[:count][order], name="Date")
+    return pd.DataFrame(
+        {name: values[col, :count][order] for col, name in enumerate(_OHLC_COLUMNS)},
+        index=index,
+    )
 
 
 def _parse_series(payload: dict[str, Any]) -> pd.DataFrame:
     series = payload.get("Time Series (Daily)", {})
-    rows: list[dict[str, Any]] = []
-    for day_str, values in series.items():
+    count = 0
+    dates = np.empty(len(series), dtype="datetime64[D]")
+    values = np.empty((6, len(series)), dtype=np.float64)
+    for day_str, row in series.items():
         try:
-            day = datetime.strptime(day_str, "%Y-%m-%d")
+            day = np.datetime64(day_str, "D")
         except ValueError:
             continue
-        open_value = values.get("1. open")
-        high_value = values.get("2. high")
-        low_value = values.get("3. low")
-        close_value = values.get("4. close")
-        adj_close_value = values.get("5. adjusted close") or values.get("4. close")
-        volume_value = values.get("6. volume") or values.get("5. volume")
+        open_value = row.get("1. open")
+        high_value = row.get("2. high")
+        low_value = row.get("3. low")
+        close_value = row.get("4. close")
+        adj_close_value = row.get("5. adjusted close") or row.get("4. close")
+        volume_value = row.get("6. volume") or row.get("5. volume")
         if None in (open_value, high_value, low_value, close_value, adj_close_value, volume_value):
             continue
-        rows.append(
-            {
-                "Date": day,
-                "Open": float(open_value),
-                "High": float(high_value),
-                "Low": float(low_value),
-                "Close": float(close_value),
-                "Adj Close": float(adj_close_value),
-                "Volume": float(volume_value),
-            }
-        )
-    if not rows:
-        return pd.DataFrame()
-    df = pd.DataFrame(rows).set_index("Date").sort_index()
-    df.index = pd.to_datetime(df.index)
-    return df
+        dates[count] = day
+        values[0, count] = float(open_value)
+        values[1, count] = float(high_value)
+        values[2, count] = float(low_value)
+        values[3, count] = float(close_value)
+        values[4, count] = float(adj_close_value)
+        values[5, count] = float(volume_value)
+        count += 1
+    return _build_frame(dates, values, count)
 
 
 def _parse_ibkr_bars(payload: dict[str, Any]) -> pd.DataFrame:
     bars = payload.get("bars", [])
-    rows: list[dict[str, Any]] = []
+    count = 0
+    dates = np.empty(len(bars), dtype="datetime64[ns]")
+    values = np.empty((6, len(bars)), dtype=np.float64)
     for bar in bars:
         if not isinstance(bar, dict):
             continue
@@ -57,7 +103,10 @@ def _parse_ibkr_bars(payload: dict[str, Any]) -> pd.DataFrame:
         if raw_date is None:
             continue
         try:
-            day = pd.to_datetime(raw_date)
+            if isinstance(raw_date, str):
+                day = _parse_bar_date(raw_date)
+            else:
+                day = pd.to_datetime(raw_date).to_datetime64()
         except Exception:
             continue
         open_value = bar.get("open")
@@ -67,49 +116,51 @@ def _parse_ibkr_bars(payload: dict[str, Any]) -> pd.DataFrame:
         volume_value = bar.get("volume")
         if None in (open_value, high_value, low_value, close_value, volume_value):
             continue
-        rows.append(
-            {
-                "Date": day,
-                "Open": float(open_value),
-                "High": float(high_value),
-                "Low": float(low_value),
-                "Close": float(close_value),
-                "Adj Close": float(close_value),
-                "Volume": float(volume_value),
-            }
-        )
-    if not rows:
-        return pd.DataFrame()
-    df = pd.DataFrame(rows).set_index("Date").sort_index()
-    df.index = pd.to_datetime(df.index)
-    return df
-
-
-def _select_output_size(start: date | None) -> str:
+        dates[count] = day
+        values[0, count] = float(open_value)
+        values[1, count] = float(high_value)
+        values[2, count] = float(low_value)
+        values[3, count] = float(close_value)
+        values[4, count] = float(close_value)
+        values[5, count] = float(volume_value)
+        count += 1
+    return _build_frame(dates, values, count)
+
+
+def _select_output_size(start: date | None, *, min_rows: int = 2) -> str:
+    """Pick the Alpha Vantage output size up front.
+
+    compact returns ~100 trading days; guessing compact and retrying with
+    full costs a wasted round trip plus parse, so go straight to full
+    whenever compact cannot plausibly satisfy the request. days * 5/7
+    discounts weekends when converting the calendar window to rows.
+    """
+
+    if min_rows > 100:
+        return "full"
     if not start:
         return "compact"
     days = (date.today() - start).days
-    return "compact" if days <= 120 else "full"
+    return "compact" if days * 5 / 7 < 100 else "full"
 
 
 async def _load_ibkr_ohlc(
     symbol: str,
     *,
-    base_url: str,
     start: date | None = None,
     min_rows: int = 2,
 ) -> pd.DataFrame:
-    url = base_url.rstrip("/") + "/prices"
-    timeout = httpx.Timeout(15.0)
-    async with httpx.AsyncClient(timeout=timeout) as client:
+    cache_key = (symbol, "ibkr", date.today())
+    df = _OHLC_CACHE.get(cache_key)
+    if df is None:
+        # Goes through the provider module so bar fetches here share its
+        # pooled keep-alive client instead of opening a fresh one per call.
         try:
-            response = await client.post(url, json={"symbol": symbol})
-        except httpx.HTTPError as exc:  # pragma: no cover - network failure handling
-            raise ValueError(f"IBKR service error: {exc}") from exc
-    if response.status_code >= 400:
-        detail = response.text
-        raise ValueError(f"IBKR service error {response.status_code}: {detail}")
-    df = _parse_ibkr_bars(response.json())
+            bars = await fetch_price_bars(symbol)
+        except IBKRServiceError as exc:
+            raise ValueError(str(exc)) from exc
+        df = _parse_ibkr_bars({"bars": bars})
+        _ohlc_cache_put(cache_key, df)
     if start and not df.empty:
         df = df.loc[pd.Timestamp(start) :]
     if df.empty:
@@ -129,23 +180,30 @@ async def load_ohlc(
     settings = get_settings()
     if settings.ibkr_service_url:
         try:
-            return await _load_ibkr_ohlc(
-                symbol,
-                base_url=settings.ibkr_service_url,
-                start=start,
-                min_rows=min_rows,
-            )
+            return await _load_ibkr_ohlc(symbol, start=start, min_rows=min_rows)
         except ValueError:
             pass
 
-    output_size = _select_output_size(start)
-    payload = await client.daily_adjusted(symbol, output=output_size)
-    df = _parse_series(payload)
+    output_size = _select_output_size(start, min_rows=min_rows)
+    # The unsliced frame is cached so callers with different start dates
+    # share one fetch and parse per symbol per day.
+    cache_key = (symbol, output_size, date.today())
+    full_df = _OHLC_CACHE.get(cache_key)
+    if full_df is None:
+        payload = await client.daily_adjusted(symbol, output=output_size)
+        full_df = _parse_series(payload)
+        _ohlc_cache_put(cache_key, full_df)
+    df = full_df
     if start and not df.empty:
         df = df.loc[pd.Timestamp(start) :]
     if len(df) < min_rows and output_size == "compact":
-        payload = await client.daily_adjusted(symbol, output="full")
-        df = _parse_series(payload)
+        cache_key = (symbol, "full", date.today())
+        full_df = _OHLC_CACHE.get(cache_key)
+        if full_df is None:
+            payload = await client.daily_adjusted(symbol, output="full")
+            full_df = _parse_series(payload)
+            _ohlc_cache_put(cache_key, full_df)
+        df = full_df
         if start and not df.empty:
             df = df.loc[pd.Timestamp(start) :]
     if df.empty:
@@ -155,4 +213,33 @@ async def load_ohlc(
     return df
 
 
-__all__ = ["load_ohlc"]
+async def load_many_ohlc(
+    symbols: Sequence[str],
+    client: AlphaVantageClient,
+    *,
+    start: date | None = None,
+    min_rows: int = 2,
+    concurrency: int = 5,
+) -> dict[str, pd.DataFrame | ValueError]:
+    """Load OHLC frames for several symbols concurrently.
+
+    Sequential awaits serialize a network round trip per symbol; fanning
+    out with a semaphore overlaps them while staying under the provider
+    rate limit. One failed symbol must not sink the whole refresh, so
+    failures come back as the raised ValueError under the symbol's key.
+    """
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def load_one(symbol: str) -> tuple[str, pd.DataFrame | ValueError]:
+        async with semaphore:
+            try:
+                return symbol, await load_ohlc(symbol, client, start=start, min_rows=min_rows)
+            except ValueError as exc:
+                return symbol, exc
+
+    results = await asyncio.gather(*(load_one(symbol) for symbol in symbols))
+    return dict(results)
+
+
+__all__ = ["load_ohlc", "load_many_ohlc"]
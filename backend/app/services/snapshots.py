@@ -2,38 +2,43 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from datetime import date
-from decimal import Decimal, getcontext
+from decimal import Decimal
 from typing import Iterable, List, Sequence
 
-from app.config import get_settings
+import numpy as np
 
-getcontext().prec = 28
+from app.config import get_settings
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionInput:
-    """Normalized transaction input for lot building."""
+    """Normalized transaction input for lot building.
+
+    Numeric fields are coerced to float inside :func:`compute_daily`, so
+    callers may pass Decimal or float interchangeably.
+    """
 
     id: str
     date: date
     type: str
-    quantity: Decimal
-    price: Decimal
-    fee: Decimal = Decimal("0")
-    tax: Decimal = Decimal("0")
+    quantity: Decimal | float
+    price: Decimal | float
+    fee: Decimal | float = 0.0
+    tax: Decimal | float = 0.0
     specific_lot_ids: Sequence[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LotPosition:
     lot_id: str
-    quantity: Decimal
-    cost_per_share: Decimal
+    quantity: float
+    cost_per_share: float
 
 
-@dataclass
+@dataclass(slots=True)
 class DailySnapshot:
     symbol: str
     date: date
@@ -48,109 +53,147 @@ class DailySnapshot:
     drawdown_from_peak_pct: Decimal
 
 
-def _pop_lot(lots: list[LotPosition], method: str) -> LotPosition:
+def _pop_lot(lots: deque[LotPosition], method: str) -> LotPosition:
+    # deque makes both ends O(1); list.pop(0) would shift every element.
     if method == "FIFO":
-        return lots.pop(0)
+        return lots.popleft()
     if method == "LIFO":
         return lots.pop()
-    return lots.pop(0)
+    return lots.popleft()
+
+
+def _to_decimal(value: float) -> Decimal:
+    """Round a float back to Decimal at the snapshot boundary.
+
+    Six fractional digits is far below any money precision we report and
+    absorbs the binary-float noise the vectorized arithmetic introduces.
+    """
+
+    return Decimal(str(round(value, 6)))
 
 
 def compute_daily(
     symbol: str,
     transactions: Iterable[TransactionInput],
-    price_series: dict[date, Decimal],
+    price_series: dict[date, Decimal | float],
     *,
     lot_method: str = "FIFO",
-    estimated_sell_fee_bps: Decimal | None = None,
-    estimated_sell_fee_flat: Decimal | None = None,
+    estimated_sell_fee_bps: Decimal | float | None = None,
+    estimated_sell_fee_flat: Decimal | float | None = None,
 ) -> List[DailySnapshot]:
-    """Compute daily portfolio snapshots according to §3–§4."""
+    """Compute daily portfolio snapshots according to §3–§4.
+
+    Positions change only on transaction days, so lot consumption runs as a
+    Python loop over transactions (O(T)) while the per-day market value,
+    hypothetical liquidation, peak and drawdown series are computed as
+    float64 array operations over the whole price history. Decimal appears
+    only at the :class:`DailySnapshot` boundary.
+    """
 
     settings = get_settings()
-    fee_bps = (
-        Decimal(estimated_sell_fee_bps)
+    fee_bps = float(
+        estimated_sell_fee_bps
         if estimated_sell_fee_bps is not None
-        else Decimal(str(settings.estimated_sell_fee_bps))
+        else settings.estimated_sell_fee_bps
     )
-    fee_flat = (
-        Decimal(estimated_sell_fee_flat)
+    fee_flat = float(
+        estimated_sell_fee_flat
         if estimated_sell_fee_flat is not None
-        else Decimal(str(settings.estimated_sell_fee_flat))
+        else settings.estimated_sell_fee_flat
+    )
+
+    price_days = sorted(price_series.keys())
+    if not price_days:
+        return []
+    prices = np.fromiter(
+        (float(price_series[day]) for day in price_days), dtype=np.float64, count=len(price_days)
     )
 
-    lots: list[LotPosition] = []
-    realized_pl = Decimal("0")
-    snapshots: list[DailySnapshot] = []
-    transactions_by_date: dict[date, list[TransactionInput]] = {}
+    # Replay transactions in order, tracking lot state and running totals;
+    # only the post-transaction state per day matters for the day scan.
+    # Transactions on days without a price row are skipped, matching the
+    # original per-price-day loop.
+    day_set = set(price_days)
+    lots: deque[LotPosition] = deque()
+    realized_pl = 0.0
+    running_shares = 0.0
+    running_cost = 0.0
+    state_by_day: dict[date, tuple[float, float, float]] = {}
     for tx in sorted(transactions, key=lambda t: (t.date, t.id)):
-        transactions_by_date.setdefault(tx.date, []).append(tx)
-    peak_hypo = Decimal("-Infinity")
-
-    for day in sorted(price_series.keys()):
-        day_price = price_series[day]
-        for tx in transactions_by_date.get(day, []):
-            if tx.type == "BUY":
-                cost = tx.quantity * tx.price + tx.fee + tx.tax
-                lot = LotPosition(lot_id=tx.id, quantity=tx.quantity, cost_per_share=cost / tx.quantity)
-                lots.append(lot)
-            elif tx.type == "SELL":
-                qty_to_close = -tx.quantity if tx.quantity < 0 else tx.quantity
-                qty_to_close = abs(qty_to_close)
-                remaining = qty_to_close
-                proceeds = qty_to_close * tx.price - tx.fee - tx.tax
-                lot_cost_total = Decimal("0")
-                while remaining > 0 and lots:
-                    lot = _pop_lot(lots, lot_method)
-                    take_qty = min(lot.quantity, remaining)
-                    lot_cost_total += take_qty * lot.cost_per_share
-                    lot.quantity -= take_qty
-                    remaining -= take_qty
-                    if lot.quantity > 0:
-                        if lot_method == "FIFO":
-                            lots.insert(0, lot)
-                        else:
-                            lots.append(lot)
-                realized_pl += proceeds - lot_cost_total
-            # TODO: handle DIVIDEND/FEE/SPLIT events as needed
-        shares_open = sum(lot.quantity for lot in lots)
-        cost_basis_open = sum(lot.quantity * lot.cost_per_share for lot in lots)
-        market_value = shares_open * day_price
-        unrealized = market_value - cost_basis_open
-        if shares_open == 0:
-            hypo_liquidation = realized_pl
-            day_opp = Decimal("0")
-        else:
-            hypo_proceeds = market_value
-            if fee_bps:
-                hypo_proceeds *= Decimal("1") - (fee_bps / Decimal("10000"))
-            hypo_proceeds -= fee_flat
-            if hypo_proceeds < 0:
-                hypo_proceeds = Decimal("0")
-            hypo_liquidation = realized_pl + (hypo_proceeds - cost_basis_open)
-            day_opp = max(Decimal("0"), hypo_liquidation - realized_pl)
-        if peak_hypo == Decimal("-Infinity"):
-            peak_hypo = hypo_liquidation
-        peak_hypo = max(peak_hypo, hypo_liquidation)
-        drawdown = Decimal("0")
-        if peak_hypo != 0:
-            drawdown = (hypo_liquidation - peak_hypo) / peak_hypo * Decimal("100")
-        snapshots.append(
-            DailySnapshot(
-                symbol=symbol,
-                date=day,
-                shares_open=shares_open,
-                market_value_base=market_value,
-                cost_basis_open_base=cost_basis_open,
-                unrealized_pl_base=unrealized,
-                realized_pl_to_date_base=realized_pl,
-                hypo_liquidation_pl_base=hypo_liquidation,
-                day_opportunity_base=day_opp,
-                peak_hypo_pl_to_date_base=peak_hypo,
-                drawdown_from_peak_pct=drawdown,
-            )
+        if tx.date not in day_set:
+            continue
+        quantity = float(tx.quantity)
+        price = float(tx.price)
+        fee = float(tx.fee)
+        tax = float(tx.tax)
+        if tx.type == "BUY":
+            cost = quantity * price + fee + tax
+            lots.append(LotPosition(lot_id=tx.id, quantity=quantity, cost_per_share=cost / quantity))
+            running_shares += quantity
+            running_cost += cost
+        elif tx.type == "SELL":
+            qty_to_close = abs(quantity)
+            remaining = qty_to_close
+            proceeds = qty_to_close * price - fee - tax
+            lot_cost_total = 0.0
+            while remaining > 0 and lots:
+                lot = _pop_lot(lots, lot_method)
+                take_qty = min(lot.quantity, remaining)
+                lot_cost_total += take_qty * lot.cost_per_share
+                lot.quantity -= take_qty
+                remaining -= take_qty
+                if lot.quantity > 0:
+                    if lot_method == "FIFO":
+                        lots.appendleft(lot)
+                    else:
+                        lots.append(lot)
+            realized_pl += proceeds - lot_cost_total
+            running_shares -= qty_to_close - remaining
+            running_cost -= lot_cost_total
+        # TODO: handle DIVIDEND/FEE/SPLIT events as needed
+        state_by_day[tx.date] = (running_shares, running_cost, realized_pl)
+
+    # Expand the step-function state onto the full price-day axis: each day
+    # picks up the latest transaction state at or before it.
+    event_days = sorted(state_by_day.keys())
+    day_axis = np.array(price_days, dtype="datetime64[D]")
+    event_axis = np.array(event_days, dtype="datetime64[D]")
+    state_idx = np.searchsorted(event_axis, day_axis, side="right")
+    shares_steps = np.array([0.0] + [state_by_day[d][0] for d in event_days])
+    cost_steps = np.array([0.0] + [state_by_day[d][1] for d in event_days])
+    realized_steps = np.array([0.0] + [state_by_day[d][2] for d in event_days])
+    shares_open = shares_steps[state_idx]
+    cost_basis_open = cost_steps[state_idx]
+    realized = realized_steps[state_idx]
+
+    market_value = shares_open * prices
+    unrealized = market_value - cost_basis_open
+    hypo_proceeds = market_value * (1.0 - fee_bps / 10000.0) - fee_flat
+    np.maximum(hypo_proceeds, 0.0, out=hypo_proceeds)
+    open_mask = shares_open != 0.0
+    hypo_liquidation = np.where(open_mask, realized + (hypo_proceeds - cost_basis_open), realized)
+    day_opportunity = np.where(open_mask, np.maximum(hypo_liquidation - realized, 0.0), 0.0)
+    peak_hypo = np.maximum.accumulate(hypo_liquidation)
+    drawdown = np.where(
+        peak_hypo != 0.0, (hypo_liquidation - peak_hypo) / np.where(peak_hypo != 0.0, peak_hypo, 1.0) * 100.0, 0.0
+    )
+
+    return [
+        DailySnapshot(
+            symbol=symbol,
+            date=day,
+            shares_open=_to_decimal(shares_open[i]),
+            market_value_base=_to_decimal(market_value[i]),
+            cost_basis_open_base=_to_decimal(cost_basis_open[i]),
+            unrealized_pl_base=_to_decimal(unrealized[i]),
+            realized_pl_to_date_base=_to_decimal(realized[i]),
+            hypo_liquidation_pl_base=_to_decimal(hypo_liquidation[i]),
+            day_opportunity_base=_to_decimal(day_opportunity[i]),
+            peak_hypo_pl_to_date_base=_to_decimal(peak_hypo[i]),
+            drawdown_from_peak_pct=_to_decimal(drawdown[i]),
         )
-    return snapshots
+        for i, day in enumerate(price_days)
+    ]
 
 
 __all__ = [
@@ -8,11 +8,15 @@ API handlers or background jobs without database coupling.
 
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from decimal import Decimal, DivisionByZero, getcontext
+from decimal import Decimal, getcontext
 from enum import Enum
-from typing import Dict, Iterable, Mapping, MutableMapping, Protocol, Sequence
+from types import MappingProxyType
+from typing import Dict, Mapping, MutableMapping, Protocol, Sequence
+
+import numpy as np
 
 getcontext().prec = 28
 
@@ -138,11 +142,19 @@ class InMemoryPriceSource:
 
 
 class CachingPriceSource:
-    """Cache wrapper to avoid refetching the same price ranges."""
+    """Cache wrapper to avoid refetching the same price ranges.
+
+    One canonical full series is cached per (ticker, price_field); ranged
+    requests are served by bisect-slicing it, so differing windows never
+    trigger separate delegate fetches. Full-range requests return a
+    read-only view of the cached mapping with no per-call copy.
+    """
 
     def __init__(self, delegate: PriceSource):
         self.delegate = delegate
-        self._range_cache: MutableMapping[tuple, dict[date, Decimal]] = {}
+        self._series_cache: MutableMapping[
+            tuple, tuple[list[date], dict[date, Decimal], Mapping[date, Decimal]]
+        ] = {}
         self._latest_cache: MutableMapping[tuple, Decimal] = {}
 
     def get_price_series(
@@ -152,13 +164,19 @@ class CachingPriceSource:
         end_date: date | None,
         *,
         price_field: PriceField = PriceField.CLOSE,
-    ) -> dict[date, Decimal]:
-        key = (ticker, price_field, start_date, end_date)
-        if key not in self._range_cache:
-            self._range_cache[key] = self.delegate.get_price_series(
-                ticker, start_date, end_date, price_field=price_field
-            )
-        return dict(self._range_cache[key])
+    ) -> Mapping[date, Decimal]:
+        key = (ticker, price_field)
+        cached = self._series_cache.get(key)
+        if cached is None:
+            full = self.delegate.get_price_series(ticker, None, None, price_field=price_field)
+            cached = (sorted(full.keys()), full, MappingProxyType(full))
+            self._series_cache[key] = cached
+        dates, full, view = cached
+        lo = bisect_left(dates, start_date) if start_date else 0
+        hi = bisect_right(dates, end_date) if end_date else len(dates)
+        if lo == 0 and hi == len(dates):
+            return view
+        return {d: full[d] for d in dates[lo:hi]}
 
     def get_latest_price(
         self,
@@ -290,20 +308,30 @@ def _resolve_price_for_date(
     valuation_date: date,
     price_series: Mapping[date, Decimal],
     policy: NonTradingDayPolicy,
+    sorted_dates: Sequence[date] | None = None,
 ) -> Decimal | None:
+    """Resolve the price for a date, snapping per the non-trading policy.
+
+    Callers resolving many dates pass a pre-sorted key list so each lookup
+    is one bisect instead of re-sorting and linearly scanning the series.
+    """
+
     if valuation_date in price_series:
         return price_series[valuation_date]
-    sorted_dates = sorted(price_series.keys())
+    if sorted_dates is None:
+        sorted_dates = sorted(price_series.keys())
     if not sorted_dates:
         return None
+    # bisect_left gives the insertion point: everything before it is
+    # strictly earlier than valuation_date, everything at or after it is
+    # strictly later (the exact-match case returned above).
+    idx = bisect_left(sorted_dates, valuation_date)
     if policy == NonTradingDayPolicy.SNAP_PREV_TRADING_DAY:
-        for d in reversed(sorted_dates):
-            if d < valuation_date:
-                return price_series[d]
+        if idx > 0:
+            return price_series[sorted_dates[idx - 1]]
     elif policy == NonTradingDayPolicy.SNAP_NEXT_TRADING_DAY:
-        for d in sorted_dates:
-            if d > valuation_date:
-                return price_series[d]
+        if idx < len(sorted_dates):
+            return price_series[sorted_dates[idx]]
     return None
 
 
@@ -320,33 +348,45 @@ def _build_date_window(request: SimulationRequest, price_series: Mapping[date, D
     return [request.start_date + timedelta(days=i) for i in range(days + 1)]
 
 
-def _compute_unrealized_values(
-    sell_price: Decimal,
-    lots: Iterable[Lot],
-    *,
-    cost_mode: CostMode,
-    buy_fee: Decimal,
-    sell_fee: Decimal,
-    tax_rate: Decimal,
-) -> tuple[Decimal, Decimal, Decimal]:
-    total_shares = sum(Decimal(l.shares) for l in lots)
-    cost_value = sum(Decimal(l.buy_price) * Decimal(l.shares) for l in lots) + Decimal(buy_fee)
-    if total_shares == 0:
-        return Decimal("0"), cost_value, Decimal("0")
-    if cost_mode == CostMode.AVERAGE_COST:
-        avg_cost = cost_value / total_shares
-        base_unrealized = (sell_price - avg_cost) * total_shares
+def _row_decimal(value: float) -> Decimal:
+    """Quantize a kernel float for the Decimal fields on :class:`SeriesRow`.
+
+    Rounding at six fractional digits strips binary-float noise while
+    keeping more precision than any displayed monetary amount needs.
+    """
+
+    return Decimal(str(round(value, 6)))
+
+
+def _unrealized_for_price(
+    sell_price: float,
+    total_shares: float,
+    gross_cost: float,
+    cost_value: float,
+    sell_fee: float,
+    tax_rate: float,
+    average_mode: bool,
+) -> tuple[float, float, float]:
+    """Per-date valuation from precomputed lot totals.
+
+    Both cost modes reduce to two scalar operations on the aggregates —
+    sum((sell - buy) * shares) is algebraically sell * total - gross_cost
+    — so nothing per-lot runs inside the valuation-date loop. Mirrors the
+    original branch structure exactly, including the buy-fee treatment
+    that differs between AVERAGE_COST and FIFO/LIFO.
+    """
+
+    if total_shares == 0.0:
+        return 0.0, cost_value, 0.0
+    if average_mode:
+        base_unrealized = (sell_price - cost_value / total_shares) * total_shares
     else:
-        base_unrealized = sum((sell_price - Decimal(l.buy_price)) * Decimal(l.shares) for l in lots)
-    net_unrealized = base_unrealized - Decimal(sell_fee)
+        base_unrealized = sell_price * total_shares - gross_cost
+    net_unrealized = base_unrealized - sell_fee
     if tax_rate:
-        taxable = max(Decimal("0"), net_unrealized)
-        net_unrealized = taxable * (Decimal("1") - Decimal(tax_rate)) + min(Decimal("0"), net_unrealized)
+        taxable = max(0.0, net_unrealized)
+        net_unrealized = taxable * (1.0 - tax_rate) + min(0.0, net_unrealized)
     market_value = sell_price * total_shares
-    try:
-        pct = net_unrealized / cost_value if cost_value != 0 else Decimal("0")
-    except DivisionByZero:
-        pct = Decimal("0")
     return net_unrealized, cost_value, market_value
 
 
@@ -372,19 +412,30 @@ def simulate_unrealized_series(
     if not price_series:
         return SeriesResponse(rows=[], summary=SeriesSummary())
     valuation_dates = _build_date_window(request, price_series)
+    # The lot aggregates depend only on the lot set, never on the date, so
+    # compute them once: the loop below is pure scalar arithmetic per date.
+    shares_arr = np.array([float(l.shares) for l in lots], dtype=np.float64)
+    buy_arr = np.array([float(l.buy_price) for l in lots], dtype=np.float64)
+    total_shares_f = float(shares_arr.sum())
+    gross_cost = float((buy_arr * shares_arr).sum())
+    cost_value_f = gross_cost + float(request.buy_fee)
+    sell_fee = float(request.sell_fee)
+    tax_rate = float(request.tax_rate)
+    average_mode = request.cost_mode == CostMode.AVERAGE_COST
+    sorted_price_dates = sorted(price_series.keys())
     rows: list[SeriesRow] = []
     for valuation_date in valuation_dates:
-        sell_price = _resolve_price_for_date(valuation_date, price_series, request.non_trading_day_policy)
+        sell_price = _resolve_price_for_date(
+            valuation_date, price_series, request.non_trading_day_policy, sorted_price_dates
+        )
         if sell_price is None:
             continue
-        unrealized, cost_value, market_value = _compute_unrealized_values(
-            sell_price,
-            lots,
-            cost_mode=request.cost_mode,
-            buy_fee=request.buy_fee,
-            sell_fee=request.sell_fee,
-            tax_rate=request.tax_rate,
+        unrealized_f, cost_f, market_f = _unrealized_for_price(
+            float(sell_price), total_shares_f, gross_cost, cost_value_f, sell_fee, tax_rate, average_mode
         )
+        unrealized = _row_decimal(unrealized_f)
+        cost_value = _row_decimal(cost_f)
+        market_value = _row_decimal(market_f)
         row = SeriesRow(
             date=valuation_date,
             ticker=request.ticker,
@@ -7,12 +7,12 @@ import asyncio
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import _session_factory
+from app.db.session import _ingest_session_factory
 from app.ingest.prices import ingest_prices
 
 
 async def _run(symbol: str) -> None:
-    async with _session_factory() as session:  # type: AsyncSession
+    async with _ingest_session_factory() as session:  # type: AsyncSession
         count = await ingest_prices(symbol, session)
         print(f"Upserted {count} price rows for {symbol}")
 
@@ -1,54 +1,133 @@
-"""Recompute daily portfolio snapshots for a symbol."""
+"""Recompute daily portfolio snapshots for one or more symbols."""
 
 from __future__ import annotations
 
 import argparse
 import asyncio
-from decimal import Decimal
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import _session_factory
-from app.models import DailyBar, Transaction
-from app.services.snapshots import TransactionInput, compute_daily
+from app.models import DailyBar, DailyPortfolioSnapshot, Portfolio, Transaction
+from app.services.snapshots import DailySnapshot, TransactionInput, compute_daily
 
+_SNAPSHOT_FIELDS = (
+    "shares_open",
+    "market_value_base",
+    "cost_basis_open_base",
+    "unrealized_pl_base",
+    "realized_pl_to_date_base",
+    "hypo_liquidation_pl_base",
+    "day_opportunity_base",
+    "peak_hypo_pl_to_date_base",
+    "drawdown_from_peak_pct",
+)
 
-async def _run(symbol: str, method: str) -> None:
+
+async def _persist(session: AsyncSession, portfolio_id: int, snapshots: list[DailySnapshot]) -> None:
+    """Upsert snapshots in one statement instead of per-row session.add.
+
+    Rows must carry the resolved portfolio_id: the unique index that
+    arbitrates the upsert covers (portfolio_id, symbol, date), and NULLs
+    never conflict, so an unstamped row would insert a duplicate history
+    on every rerun. The conflict target is the column list rather than a
+    constraint name because the backend's startup DDL replaces the named
+    constraint with a plain unique index.
+    """
+
+    if not snapshots:
+        return
+    rows = [
+        {
+            "portfolio_id": portfolio_id,
+            "symbol": snap.symbol,
+            "date": snap.date,
+            **{field: float(getattr(snap, field)) for field in _SNAPSHOT_FIELDS},
+        }
+        for snap in snapshots
+    ]
+    stmt = pg_insert(DailyPortfolioSnapshot).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["portfolio_id", "symbol", "date"],
+        set_={field: stmt.excluded[field] for field in _SNAPSHOT_FIELDS},
+    )
+    await session.execute(stmt)
+    await session.commit()
+
+
+async def _run_one(symbol: str, method: str, persist: bool, owner: str) -> None:
+    # Each symbol gets its own session: AsyncSession is not safe to share
+    # across concurrently running tasks.
     async with _session_factory() as session:  # type: AsyncSession
+        portfolio_id = (
+            await session.execute(select(Portfolio.id).where(Portfolio.owner_id == owner))
+        ).scalar_one_or_none()
+        if portfolio_id is None:
+            print(f"No portfolio found for owner {owner}; skipping {symbol}")
+            return
+        # Column-tuple selects skip ORM hydration (identity map, lazy
+        # attribute machinery) — only these columns are ever read here —
+        # and yield_per streams large price histories in batches.
         tx_rows = (
             await session.execute(
-                select(Transaction).where(Transaction.symbol == symbol).order_by(Transaction.datetime)
+                select(
+                    Transaction.id,
+                    Transaction.datetime,
+                    Transaction.type,
+                    Transaction.qty,
+                    Transaction.price,
+                    Transaction.fee,
+                    Transaction.tax,
+                )
+                .where(Transaction.symbol == symbol, Transaction.portfolio_id == portfolio_id)
+                .order_by(Transaction.datetime)
             )
-        ).scalars().all()
-        price_rows = (
-            await session.execute(
-                select(DailyBar).where(DailyBar.symbol == symbol).order_by(DailyBar.date)
-            )
-        ).scalars().all()
-        prices = {row.date: Decimal(str(row.adj_close)) for row in price_rows}
+        ).all()
+        price_result = await session.stream(
+            select(DailyBar.date, DailyBar.adj_close)
+            .where(DailyBar.symbol == symbol)
+            .order_by(DailyBar.date)
+            .execution_options(yield_per=1000)
+        )
+        # compute_daily works in float64 internally; feeding floats directly
+        # skips a str round-trip per value.
+        prices = {day: float(adj_close) async for day, adj_close in price_result}
         transactions = [
             TransactionInput(
-                id=str(tx.id),
-                date=tx.datetime.date(),
-                type=tx.type,
-                quantity=Decimal(str(tx.qty)),
-                price=Decimal(str(tx.price)),
-                fee=Decimal(str(tx.fee or 0)),
-                tax=Decimal(str(tx.tax or 0)),
+                id=str(tx_id),
+                date=dt.date(),
+                type=tx_type,
+                quantity=float(qty),
+                price=float(price),
+                fee=float(fee or 0),
+                tax=float(tax or 0),
             )
-            for tx in tx_rows
+            for tx_id, dt, tx_type, qty, price, fee, tax in tx_rows
         ]
-        snapshots = compute_daily(symbol, transactions, prices, lot_method=method)
+        # compute_daily is CPU-bound; running it on a worker thread keeps the
+        # event loop free to drive the other symbols' queries in parallel.
+        snapshots = await asyncio.to_thread(
+            compute_daily, symbol, transactions, prices, lot_method=method
+        )
+        if persist:
+            await _persist(session, portfolio_id, snapshots)
         print(f"Computed {len(snapshots)} snapshots for {symbol} using {method}")
 
 
+async def _run(symbols: list[str], method: str, persist: bool, owner: str) -> None:
+    await asyncio.gather(*(_run_one(symbol, method, persist, owner) for symbol in symbols))
+
+
 def main() -> None:
-    parser = argparse.ArgumentParser(description="Recompute daily snapshots for a symbol")
-    parser.add_argument("--symbol", required=True)
+    parser = argparse.ArgumentParser(description="Recompute daily snapshots for one or more symbols")
+    parser.add_argument("--symbol", required=True, action="append", help="May be repeated to rebuild several symbols concurrently")
     parser.add_argument("--method", default="FIFO", choices=["FIFO", "LIFO", "SPEC_ID"])
+    parser.add_argument("--persist", action="store_true", help="Upsert results into daily_portfolio_snapshot")
+    parser.add_argument("--owner", default="system", help="Portfolio owner whose transactions and snapshots to rebuild")
     args = parser.parse_args()
-    asyncio.run(_run(args.symbol, args.method))
+    asyncio.run(_run(args.symbol, args.method, args.persist, args.owner))
 
 
 if __name__ == "__main__":
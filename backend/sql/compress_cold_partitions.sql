@@ -0,0 +1,47 @@
+-- Pack and freeze cold bar partitions.
+--
+-- The bar tables use native declarative partitioning (migration 0016), so
+-- TimescaleDB columnar compression is not available; this is the native
+-- equivalent: fully packed pages (fillfactor 100 on append-only history),
+-- rows repacked in (symbol, time) order so range scans read sequential
+-- blocks, and aggressive freezing so index-only scans skip heap visibility
+-- checks on partitions that will never change again.
+--
+-- Run periodically (e.g. nightly) with: psql -f compress_cold_partitions.sql
+-- CLUSTER takes an exclusive lock, which is why this only targets closed
+-- periods: intraday partitions older than the previous month, daily
+-- partitions older than two quarters.
+
+SELECT format('ALTER TABLE %I SET (fillfactor = 100);', c.relname)
+FROM pg_inherits i
+JOIN pg_class c ON c.oid = i.inhrelid
+JOIN pg_class p ON p.oid = i.inhparent
+WHERE p.relname IN ('daily_bar', 'intraday_bar')
+  AND c.relname ~ '_p\d{6}$'
+\gexec
+
+SELECT format('CLUSTER %I USING %I;', c.relname, ci.relname)
+FROM pg_inherits i
+JOIN pg_class c ON c.oid = i.inhrelid
+JOIN pg_class p ON p.oid = i.inhparent
+JOIN pg_index x ON x.indrelid = c.oid AND x.indisunique
+JOIN pg_class ci ON ci.oid = x.indexrelid
+WHERE (
+        p.relname = 'intraday_bar'
+        AND to_date(right(c.relname, 6), 'YYYYMM')
+            < date_trunc('month', now()) - interval '1 month'
+      )
+   OR (
+        p.relname = 'daily_bar'
+        AND to_date(right(c.relname, 6), 'YYYYMM')
+            < date_trunc('month', now()) - interval '6 months'
+      )
+\gexec
+
+SELECT format('VACUUM (FREEZE, ANALYZE) %I;', c.relname)
+FROM pg_inherits i
+JOIN pg_class c ON c.oid = i.inhrelid
+JOIN pg_class p ON p.oid = i.inhparent
+WHERE p.relname IN ('daily_bar', 'intraday_bar')
+  AND c.relname ~ '_p\d{6}$'
+\gexec
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, date
+from decimal import Decimal
 
 from pydantic import BaseModel, Field
 
@@ -32,11 +33,14 @@ class WatchlistSymbolSchema(BaseModel):
 class TransactionCreateRequest(BaseModel):
     symbol: str = Field(..., examples=["PATH"])
     type: str = Field(..., pattern="|".join(TRANSACTION_TYPES))
-    quantity: float
-    price: float
+    # Decimal fields: pydantic-core parses incoming floats/strings straight
+    # to Decimal, so the ORM layer gets exact values without a per-field
+    # Decimal(str(...)) round-trip.
+    quantity: Decimal
+    price: Decimal
     trade_datetime: datetime
-    fee: float = 0.0
-    tax: float = 0.0
+    fee: Decimal = Decimal("0")
+    tax: Decimal = Decimal("0")
     currency: str = Field(default="USD", min_length=3, max_length=3)
     account_id: int | None = Field(default=None, description="Portfolio account identifier")
     account: str | None = Field(default=None, description="Account or broker reference")
@@ -80,11 +84,11 @@ class PortfolioAccountSchema(BaseModel):
 class TransactionUpdateRequest(BaseModel):
     symbol: str = Field(..., examples=["PATH"])
     type: str = Field(..., pattern="|".join(TRANSACTION_TYPES))
-    quantity: float
-    price: float
+    quantity: Decimal
+    price: Decimal
     trade_datetime: datetime
-    fee: float = 0.0
-    tax: float = 0.0
+    fee: Decimal = Decimal("0")
+    tax: Decimal = Decimal("0")
     currency: str = Field(default="USD", min_length=3, max_length=3)
     account_id: int | None = Field(default=None, description="Portfolio account identifier")
     account: str | None = Field(default=None)
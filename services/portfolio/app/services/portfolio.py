@@ -7,6 +7,7 @@ from zoneinfo import ZoneInfo
 
 import sqlalchemy as sa
 from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -28,6 +29,41 @@ from ..schemas import (
 )
 from .snapshots import DailySnapshot, TransactionInput, compute_daily
 
+_SNAPSHOT_VALUE_FIELDS = (
+    "shares_open",
+    "market_value_base",
+    "cost_basis_open_base",
+    "unrealized_pl_base",
+    "realized_pl_to_date_base",
+    "hypo_liquidation_pl_base",
+    "day_opportunity_base",
+    "peak_hypo_pl_to_date_base",
+    "drawdown_from_peak_pct",
+)
+
+
+def snapshot_upsert_stmt(rows: list[dict]):
+    """Build the guarded snapshot diff upsert.
+
+    The conflict target must be the column list, not a constraint name:
+    the backend's startup DDL drops uq_snapshot_symbol_date and replaces
+    it with a unique *index* on the same columns, and ON CONFLICT ON
+    CONSTRAINT cannot target an index. Naming the columns lets Postgres
+    infer whichever unique arbiter is present.
+    """
+
+    stmt = pg_insert(DailyPortfolioSnapshot).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=["portfolio_id", "symbol", "date"],
+        set_={field: stmt.excluded[field] for field in _SNAPSHOT_VALUE_FIELDS},
+        where=sa.or_(
+            *(
+                getattr(DailyPortfolioSnapshot, field) != stmt.excluded[field]
+                for field in _SNAPSHOT_VALUE_FIELDS
+            )
+        ),
+    )
+
 
 async def ensure_portfolio(session: AsyncSession, owner_id: str) -> Portfolio:
     normalized = owner_id.strip()
@@ -158,10 +194,10 @@ async def create_transaction(payload: TransactionCreateRequest, session: AsyncSe
         portfolio_id=portfolio.id,
         symbol=payload.symbol.strip().upper(),
         type=tx_type,
-        qty=Decimal(str(payload.quantity)),
-        price=Decimal(str(payload.price)),
-        fee=Decimal(str(payload.fee)),
-        tax=Decimal(str(payload.tax)),
+        qty=payload.quantity,
+        price=payload.price,
+        fee=payload.fee,
+        tax=payload.tax,
         currency=payload.currency.upper(),
         datetime=trade_dt,
         broker_id=account_name,
@@ -214,10 +250,10 @@ async def update_transaction(
 
     tx.symbol = payload.symbol.strip().upper()
     tx.type = tx_type
-    tx.qty = Decimal(str(payload.quantity))
-    tx.price = Decimal(str(payload.price))
-    tx.fee = Decimal(str(payload.fee))
-    tx.tax = Decimal(str(payload.tax))
+    tx.qty = payload.quantity
+    tx.price = payload.price
+    tx.fee = payload.fee
+    tx.tax = payload.tax
     tx.currency = payload.currency.upper()
     tx.datetime = trade_dt
     tx.broker_id = account_name
@@ -362,29 +398,29 @@ async def recompute_snapshots_for_symbol(
         estimated_sell_fee_flat=Decimal(str(settings.estimated_sell_fee_flat)),
     )
 
-    await session.execute(
-        delete(DailyPortfolioSnapshot).where(
-            DailyPortfolioSnapshot.symbol == normalized,
-            DailyPortfolioSnapshot.portfolio_id == portfolio.id,
-        )
+    # A daily rebuild produces rows nearly identical to the stored ones —
+    # usually only the latest day changes — so instead of deleting and
+    # re-inserting the whole history (two index passes of WAL per row),
+    # push one upsert whose DO UPDATE is guarded to rows that actually
+    # differ, then drop only the dates no longer present.
+    rows = [
+        {
+            "portfolio_id": portfolio.id,
+            "symbol": snap.symbol,
+            "date": snap.date,
+            **{field: getattr(snap, field) for field in _SNAPSHOT_VALUE_FIELDS},
+        }
+        for snap in snapshots
+    ]
+    if rows:
+        await session.execute(snapshot_upsert_stmt(rows))
+    stale = delete(DailyPortfolioSnapshot).where(
+        DailyPortfolioSnapshot.symbol == normalized,
+        DailyPortfolioSnapshot.portfolio_id == portfolio.id,
     )
-    for snap in snapshots:
-        session.add(
-            DailyPortfolioSnapshot(
-                portfolio_id=portfolio.id,
-                symbol=snap.symbol,
-                date=snap.date,
-                shares_open=snap.shares_open,
-                market_value_base=snap.market_value_base,
-                cost_basis_open_base=snap.cost_basis_open_base,
-                unrealized_pl_base=snap.unrealized_pl_base,
-                realized_pl_to_date_base=snap.realized_pl_to_date_base,
-                hypo_liquidation_pl_base=snap.hypo_liquidation_pl_base,
-                day_opportunity_base=snap.day_opportunity_base,
-                peak_hypo_pl_to_date_base=snap.peak_hypo_pl_to_date_base,
-                drawdown_from_peak_pct=snap.drawdown_from_peak_pct,
-            )
-        )
+    if snapshots:
+        stale = stale.where(DailyPortfolioSnapshot.date.notin_([snap.date for snap in snapshots]))
+    await session.execute(stale)
     await enqueue_portfolio_event(
         session,
         "portfolio.snapshots.recomputed",
@@ -411,5 +447,6 @@ __all__ = [
     "list_accounts",
     "create_account",
     "recompute_snapshots_for_symbol",
+    "snapshot_upsert_stmt",
     "enqueue_portfolio_event",
 ]
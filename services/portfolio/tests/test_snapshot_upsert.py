@@ -0,0 +1,38 @@
+"""Tests for the snapshot diff-upsert statement."""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.portfolio import _SNAPSHOT_VALUE_FIELDS, snapshot_upsert_stmt
+
+
+def _rows() -> list[dict]:
+    return [
+        {
+            "portfolio_id": 1,
+            "symbol": "PATH",
+            "date": date(2024, 9, 10),
+            **{field: Decimal("1") for field in _SNAPSHOT_VALUE_FIELDS},
+        }
+    ]
+
+
+def test_upsert_conflict_target_is_the_unique_index_columns():
+    # The backend's startup DDL replaces the uq_snapshot_symbol_date
+    # constraint with a unique index on the same columns; a constraint-name
+    # conflict target would fail at runtime after any backend boot.
+    sql = str(snapshot_upsert_stmt(_rows()).compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (portfolio_id, symbol, date)" in sql
+    assert "ON CONSTRAINT" not in sql
+
+
+def test_upsert_updates_are_guarded_to_changed_rows():
+    sql = str(snapshot_upsert_stmt(_rows()).compile(dialect=postgresql.dialect()))
+    do_update = sql.split("DO UPDATE", 1)[1]
+    assert "WHERE" in do_update
+    for field in _SNAPSHOT_VALUE_FIELDS:
+        assert f"excluded.{field}" in do_update